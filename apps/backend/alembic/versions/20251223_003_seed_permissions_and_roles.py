@@ -6,7 +6,6 @@ Create Date: 2025-12-23 16:45:00.000000
 
 """
 from typing import Sequence, Union
-from datetime import datetime
 import uuid
 
 from alembic import op
@@ -19,9 +18,40 @@ down_revision: Union[str, None] = '002'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Lightweight table definitions so inserts are Core insert() constructs, which
+# SQLAlchemy 2.0 renders as a single multi-row INSERT ... VALUES (insertmanyvalues)
+# instead of the driver-side executemany loop used for plain text statements.
+permissions_table = sa.table(
+    'permissions',
+    sa.column('id', postgresql.UUID(as_uuid=True)),
+    sa.column('name', sa.String),
+    sa.column('description', sa.String),
+)
+
+roles_table = sa.table(
+    'roles',
+    sa.column('id', postgresql.UUID(as_uuid=True)),
+    sa.column('name', sa.String),
+    sa.column('description', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+
+# role_permissions is filled from two parallel arrays in a single statement
+uuid_array = postgresql.ARRAY(postgresql.UUID(as_uuid=True))
+role_permissions_insert = sa.text(
+    "INSERT INTO role_permissions (role_id, permission_id) "
+    "SELECT * FROM unnest(CAST(:role_ids AS uuid[]), CAST(:permission_ids AS uuid[]))"
+).bindparams(
+    sa.bindparam('role_ids', type_=uuid_array),
+    sa.bindparam('permission_ids', type_=uuid_array),
+)
+
 
 def upgrade() -> None:
-    # Get connection for data operations
+    # Get connection for data operations. The seed is three statements (permissions,
+    # roles, role_permissions) that run inside Alembic's migration transaction, so
+    # they commit together. Do not wrap them in autocommit_block(): that would commit
+    # each statement on its own and a failure could leave a half-seeded RBAC schema.
     connection = op.get_bind()
 
     # Define all system permissions
@@ -51,18 +81,13 @@ def upgrade() -> None:
         {'name': 'admin:access', 'description': 'Access admin panel'},
     ]
 
-    # Insert permissions and store their IDs
-    permission_ids = {}
-    for perm in permissions:
-        perm_id = str(uuid.uuid4())
-        connection.execute(
-            sa.text(
-                "INSERT INTO permissions (id, name, description) "
-                "VALUES (:id, :name, :description)"
-            ),
-            {'id': perm_id, 'name': perm['name'], 'description': perm['description']}
-        )
-        permission_ids[perm['name']] = perm_id
+    # Pre-generate permission IDs as native UUIDs (bound without a str round-trip)
+    perm_rows = [
+        {'id': uuid.uuid4(), 'name': perm['name'], 'description': perm['description']}
+        for perm in permissions
+    ]
+    permission_ids = {row['name']: row['id'] for row in perm_rows}
+    connection.execute(sa.insert(permissions_table), perm_rows)
 
     # Define default roles
     roles = [
@@ -103,34 +128,31 @@ def upgrade() -> None:
         }
     ]
 
-    # Insert roles and role_permissions
+    # Build role rows and the flattened role/permission pairs up front
+    role_rows = []
+    role_ids_flat = []
+    permission_ids_flat = []
     for role in roles:
-        role_id = str(uuid.uuid4())
-        connection.execute(
-            sa.text(
-                "INSERT INTO roles (id, name, description, created_at) "
-                "VALUES (:id, :name, :description, :created_at)"
-            ),
-            {
-                'id': role_id,
-                'name': role['name'],
-                'description': role['description'],
-                'created_at': datetime.utcnow()
-            }
-        )
-
-        # Insert role_permissions associations
+        role_id = uuid.uuid4()
+        role_rows.append({
+            'id': role_id,
+            'name': role['name'],
+            'description': role['description']
+        })
         for perm_name in role['permissions']:
-            connection.execute(
-                sa.text(
-                    "INSERT INTO role_permissions (role_id, permission_id) "
-                    "VALUES (:role_id, :permission_id)"
-                ),
-                {
-                    'role_id': role_id,
-                    'permission_id': permission_ids[perm_name]
-                }
-            )
+            role_ids_flat.append(role_id)
+            permission_ids_flat.append(permission_ids[perm_name])
+
+    # created_at is stamped by Postgres (UTC, matching datetime.utcnow) in the
+    # statement itself rather than bound per row
+    connection.execute(
+        sa.insert(roles_table).values(created_at=sa.func.timezone('utc', sa.func.now())),
+        role_rows
+    )
+    connection.execute(
+        role_permissions_insert,
+        {'role_ids': role_ids_flat, 'permission_ids': permission_ids_flat}
+    )
 
 
 def downgrade() -> None:
@@ -0,0 +1,48 @@
+"""Add composite indexes for activity_logs feed queries
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Per-user activity feed ordered by recency (GET /activity-logs/me)
+        op.create_index(
+            'ix_activity_logs_user_created',
+            'activity_logs',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        # Per-resource timeline (filter by resource_type/resource_id, newest first)
+        op.create_index(
+            'ix_activity_logs_resource_created',
+            'activity_logs',
+            ['resource_type', 'resource_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_activity_logs_resource_created',
+            'activity_logs',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_activity_logs_user_created',
+            'activity_logs',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,60 @@
+"""Drop single-column activity_logs indexes covered by composites
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # Action filter is always combined with newest-first ordering
+        op.create_index(
+            'ix_activity_logs_action_created',
+            'activity_logs',
+            ['action', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+
+        # Leading columns of ix_activity_logs_user_created and
+        # ix_activity_logs_resource_created already serve these lookups
+        for index_name in (
+            'ix_activity_logs_action',
+            'ix_activity_logs_user_id',
+            'ix_activity_logs_resource_type',
+            'ix_activity_logs_resource_id',
+        ):
+            op.drop_index(index_name, 'activity_logs', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_activity_logs_resource_id', 'activity_logs', ['resource_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_activity_logs_resource_type', 'activity_logs', ['resource_type'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_activity_logs_user_id', 'activity_logs', ['user_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_activity_logs_action', 'activity_logs', ['action'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_activity_logs_action_created', 'activity_logs',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,48 @@
+"""Make the activity_logs resource timeline index partial
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # Events without a resource (e.g. logins) never appear in per-resource
+        # timelines, so leave them out of the index entirely
+        op.create_index(
+            'ix_activity_logs_resource',
+            'activity_logs',
+            ['resource_type', 'resource_id', sa.text('created_at DESC')],
+            postgresql_where=sa.text('resource_id IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_activity_logs_resource_created',
+            'activity_logs',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_activity_logs_resource_created',
+            'activity_logs',
+            ['resource_type', 'resource_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_activity_logs_resource',
+            'activity_logs',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,37 @@
+"""Store activity_logs.extra_data as JSONB
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'activity_logs',
+        'extra_data',
+        type_=postgresql.JSONB,
+        existing_type=postgresql.JSON,
+        existing_nullable=True,
+        postgresql_using='extra_data::jsonb',
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'activity_logs',
+        'extra_data',
+        type_=postgresql.JSON,
+        existing_type=postgresql.JSONB,
+        existing_nullable=True,
+        postgresql_using='extra_data::json',
+    )
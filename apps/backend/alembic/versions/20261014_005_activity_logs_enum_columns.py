@@ -0,0 +1,69 @@
+"""Store activity_logs action and resource_type as Postgres enums
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+ACTIONS = ('document.upload', 'document.delete', 'document.share', 'user.login')
+RESOURCE_TYPES = ('document', 'user', 'role')
+
+activity_action = postgresql.ENUM(*ACTIONS, name='activityaction')
+activity_resource_type = postgresql.ENUM(*RESOURCE_TYPES, name='activityresourcetype')
+
+
+def upgrade():
+    bind = op.get_bind()
+    activity_action.create(bind, checkfirst=True)
+    activity_resource_type.create(bind, checkfirst=True)
+
+    # 4-byte enum values instead of variable-length text in every row and index entry
+    op.alter_column(
+        'activity_logs',
+        'action',
+        type_=activity_action,
+        existing_type=sa.String(100),
+        existing_nullable=False,
+        postgresql_using='action::activityaction',
+    )
+    op.alter_column(
+        'activity_logs',
+        'resource_type',
+        type_=activity_resource_type,
+        existing_type=sa.String(50),
+        existing_nullable=False,
+        postgresql_using='resource_type::activityresourcetype',
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'activity_logs',
+        'resource_type',
+        type_=sa.String(50),
+        existing_type=activity_resource_type,
+        existing_nullable=False,
+        postgresql_using='resource_type::text',
+    )
+    op.alter_column(
+        'activity_logs',
+        'action',
+        type_=sa.String(100),
+        existing_type=activity_action,
+        existing_nullable=False,
+        postgresql_using='action::text',
+    )
+
+    bind = op.get_bind()
+    activity_resource_type.drop(bind, checkfirst=True)
+    activity_action.drop(bind, checkfirst=True)
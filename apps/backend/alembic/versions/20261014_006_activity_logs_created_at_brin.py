@@ -0,0 +1,44 @@
+"""Use a BRIN index for activity_logs.created_at
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # Rows are appended in created_at order, so per-block-range min/max
+        # summaries prune time ranges at a fraction of a btree's size and
+        # insert cost. Keyed feeds keep using the composite btrees.
+        op.drop_index(
+            'ix_activity_logs_created_at',
+            'activity_logs',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_activity_logs_created_at',
+            'activity_logs',
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_activity_logs_created_at', 'activity_logs')
+        op.create_index(
+            'ix_activity_logs_created_at',
+            'activity_logs',
+            ['created_at'],
+            postgresql_concurrently=True,
+        )
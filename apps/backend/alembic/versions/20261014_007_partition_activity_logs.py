@@ -0,0 +1,127 @@
+"""Partition activity_logs by month on created_at
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-14
+
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# Monthly partitions created ahead of the current month; the
+# maintain_activity_log_partitions beat task keeps this window rolling
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, action, resource_type, resource_id, description, "
+    "extra_data, ip_address, user_agent, created_at"
+)
+
+COLUMN_DDL = """
+    id UUID NOT NULL,
+    user_id UUID REFERENCES users (id) ON DELETE SET NULL,
+    action activityaction NOT NULL,
+    resource_type activityresourcetype NOT NULL,
+    resource_id UUID,
+    description TEXT NOT NULL,
+    extra_data JSONB,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(500),
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()
+"""
+
+
+def _add_months(month: date, months: int) -> date:
+    """Return the first day of the month `months` after `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    """Create the activity_logs indexes (mirrors migrations 005-010)."""
+    op.create_index(
+        'ix_activity_logs_user_created',
+        'activity_logs',
+        ['user_id', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_activity_logs_action_created',
+        'activity_logs',
+        ['action', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_activity_logs_resource',
+        'activity_logs',
+        ['resource_type', 'resource_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('resource_id IS NOT NULL'),
+    )
+    op.create_index(
+        'ix_activity_logs_created_at',
+        'activity_logs',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    # Move the existing table (and its primary key index name) out of the way
+    op.execute("ALTER TABLE activity_logs RENAME TO activity_logs_unpartitioned")
+    op.execute("ALTER INDEX activity_logs_pkey RENAME TO activity_logs_unpartitioned_pkey")
+
+    # Partition keys must be part of the primary key
+    op.execute(
+        f"CREATE TABLE activity_logs ({COLUMN_DDL}, PRIMARY KEY (id, created_at)) "
+        "PARTITION BY RANGE (created_at)"
+    )
+
+    oldest = connection.execute(
+        sa.text("SELECT min(created_at) FROM activity_logs_unpartitioned")
+    ).scalar()
+    current = datetime.utcnow().date().replace(day=1)
+    month = oldest.date().replace(day=1) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE activity_logs_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF activity_logs FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{upper.isoformat()}')"
+        )
+        month = upper
+
+    # Catch-all so inserts never fail if the rolling task falls behind
+    op.execute("CREATE TABLE activity_logs_default PARTITION OF activity_logs DEFAULT")
+
+    op.execute(
+        f"INSERT INTO activity_logs ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM activity_logs_unpartitioned"
+    )
+    op.execute("DROP TABLE activity_logs_unpartitioned")
+
+    _create_indexes()
+
+
+def downgrade():
+    op.execute(f"CREATE TABLE activity_logs_unpartitioned ({COLUMN_DDL}, PRIMARY KEY (id))")
+    op.execute(
+        f"INSERT INTO activity_logs_unpartitioned ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM activity_logs"
+    )
+
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE activity_logs")
+    op.execute("ALTER TABLE activity_logs_unpartitioned RENAME TO activity_logs")
+    op.execute("ALTER INDEX activity_logs_unpartitioned_pkey RENAME TO activity_logs_pkey")
+
+    _create_indexes()
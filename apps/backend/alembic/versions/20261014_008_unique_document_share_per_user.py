@@ -0,0 +1,35 @@
+"""Enforce one share per document and user
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Drop any duplicates that slipped past the old check-then-insert, keeping the oldest
+    op.execute("""
+        DELETE FROM document_shares a
+        USING document_shares b
+        WHERE a.document_id = b.document_id
+        AND a.shared_with_user_id = b.shared_with_user_id
+        AND (a.created_at, a.id) > (b.created_at, b.id)
+    """)
+
+    op.create_unique_constraint(
+        'uq_document_shares_document_user',
+        'document_shares',
+        ['document_id', 'shared_with_user_id'],
+    )
+
+
+def downgrade():
+    op.drop_constraint('uq_document_shares_document_user', 'document_shares', type_='unique')
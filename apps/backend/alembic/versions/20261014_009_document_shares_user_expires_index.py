@@ -0,0 +1,44 @@
+"""Composite index for the shared-with-me listing
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # shared-with-me filters by recipient and non-expired shares
+        op.create_index(
+            'ix_document_shares_user_expires',
+            'document_shares',
+            ['shared_with_user_id', 'expires_at'],
+            postgresql_concurrently=True,
+        )
+
+        # Leading column of the composite already serves recipient lookups
+        op.drop_index(
+            'ix_document_shares_shared_with_user_id', 'document_shares',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_document_shares_shared_with_user_id', 'document_shares',
+            ['shared_with_user_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_document_shares_user_expires', 'document_shares',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,58 @@
+"""Covering unique index for per-document share lookups
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # Access checks look up (document, recipient) and read the level and expiry;
+        # INCLUDE-ing them lets that lookup be an index-only scan
+        op.create_index(
+            'ix_document_shares_document_user',
+            'document_shares',
+            ['document_id', 'shared_with_user_id'],
+            unique=True,
+            postgresql_include=['permission_level', 'expires_at'],
+            postgresql_concurrently=True,
+        )
+
+    # The new unique index enforces the same rule
+    op.drop_constraint('uq_document_shares_document_user', 'document_shares', type_='unique')
+
+    with op.get_context().autocommit_block():
+        # Leading column of the composite already serves per-document lookups
+        op.drop_index(
+            'ix_document_shares_document_id', 'document_shares',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_document_shares_document_id', 'document_shares', ['document_id'],
+            postgresql_concurrently=True,
+        )
+
+    op.create_unique_constraint(
+        'uq_document_shares_document_user',
+        'document_shares',
+        ['document_id', 'shared_with_user_id'],
+    )
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_document_shares_document_user', 'document_shares',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""Encrypt stored IMAP passwords
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.encryption import decrypt_str, encrypt_str
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('import_sources', sa.Column('imap_password_encrypted', postgresql.BYTEA(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, imap_password FROM import_sources WHERE imap_password IS NOT NULL"
+    )).fetchall()
+    for source_id, password in rows:
+        conn.execute(
+            sa.text("UPDATE import_sources SET imap_password_encrypted = :value WHERE id = :id"),
+            {'value': encrypt_str(password), 'id': source_id},
+        )
+
+    op.drop_column('import_sources', 'imap_password')
+    op.alter_column('import_sources', 'imap_password_encrypted', new_column_name='imap_password')
+
+
+def downgrade():
+    op.add_column('import_sources', sa.Column('imap_password_plain', sa.String(length=255), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, imap_password FROM import_sources WHERE imap_password IS NOT NULL"
+    )).fetchall()
+    for source_id, data in rows:
+        conn.execute(
+            sa.text("UPDATE import_sources SET imap_password_plain = :value WHERE id = :id"),
+            {'value': decrypt_str(data), 'id': source_id},
+        )
+
+    op.drop_column('import_sources', 'imap_password')
+    op.alter_column('import_sources', 'imap_password_plain', new_column_name='imap_password')
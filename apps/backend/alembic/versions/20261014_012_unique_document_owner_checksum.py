@@ -0,0 +1,39 @@
+"""Enforce one document per owner and checksum
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Duplicates could slip past the old check-then-insert on concurrent uploads.
+    # Keep those documents but clear the checksum on all but the oldest, so they
+    # no longer take part in deduplication
+    op.execute("""
+        UPDATE documents a
+        SET checksum = NULL
+        FROM documents b
+        WHERE a.owner_id = b.owner_id
+        AND a.checksum = b.checksum
+        AND (a.created_at, a.id) > (b.created_at, b.id)
+    """)
+
+    op.create_index(
+        'ix_documents_owner_checksum',
+        'documents',
+        ['owner_id', 'checksum'],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_documents_owner_checksum', table_name='documents')
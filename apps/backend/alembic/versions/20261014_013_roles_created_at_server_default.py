@@ -0,0 +1,29 @@
+"""Default roles.created_at to the current UTC time in Postgres
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # created_at is a naive timestamp holding UTC (datetime.utcnow), so now() alone
+    # would store the server's local time
+    op.alter_column(
+        'roles',
+        'created_at',
+        server_default=sa.text("timezone('utc', now())"),
+    )
+
+
+def downgrade():
+    op.alter_column('roles', 'created_at', server_default=None)
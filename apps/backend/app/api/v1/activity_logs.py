@@ -7,7 +7,7 @@ from uuid import UUID
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
-from app.models.activity_log import ActivityLog
+from app.models.activity_log import ActivityAction, ActivityLog, ActivityResourceType
 from app.schemas.activity_log import ActivityLogResponse
 
 router = APIRouter()
@@ -17,9 +17,9 @@ router = APIRouter()
 def list_activity_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    resource_type: Optional[str] = None,
+    resource_type: Optional[ActivityResourceType] = None,
     resource_id: Optional[UUID] = None,
-    action: Optional[str] = None,
+    action: Optional[ActivityAction] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.exceptions import AuthenticationError, DuplicateError
 from app.core.security import decode_token
@@ -34,7 +35,8 @@ async def register(
         HTTPException: If email or username already exists
     """
     try:
-        user = auth_service.register_user(user_data)
+        # bcrypt hashing is CPU-bound; keep it off the event loop
+        user = await run_in_threadpool(auth_service.register_user, user_data)
         return user
     except DuplicateError as e:
         raise HTTPException(
@@ -62,7 +64,8 @@ async def login(
         HTTPException: If credentials are invalid
     """
     try:
-        tokens = auth_service.authenticate_user(login_data)
+        # bcrypt verification is CPU-bound; keep it off the event loop
+        tokens = await run_in_threadpool(auth_service.authenticate_user, login_data)
         return tokens
     except AuthenticationError as e:
         raise HTTPException(
@@ -1,15 +1,19 @@
 """Chat API endpoints for RAG-based document Q&A."""
 import logging
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.core.exceptions import CartularyException
 from app.database import get_db
 from app.models.user import User
 from app.schemas.chat import ChatRequest, ChatResponse
 from app.services.chat_service import ChatService
 from app.services.vector_search_service import VectorSearchService
 from app.services.llm_service import LLMService
-from app.services.embedding_service import EmbeddingService
+from app.services.embedding_service import get_embedding_service
 from app.api.v1.auth import get_current_user
 from app.config import settings
 
@@ -18,35 +22,32 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
-def get_chat_service(db: Session = Depends(get_db)) -> ChatService:
-    """Get chat service with dependencies."""
-    # Create embedding service
-    embedding_service = EmbeddingService(
-        provider=settings.EMBEDDING_PROVIDER,
-        model_name=settings.EMBEDDING_MODEL,
-        api_key=settings.OPENAI_API_KEY if settings.EMBEDDING_PROVIDER == "openai" else None,
-        dimension=settings.EMBEDDING_DIMENSION,
-    )
-
-    # Create vector search service
-    vector_search_service = VectorSearchService(
-        db=db,
-        embedding_service=embedding_service,
-    )
-
-    # Create LLM service
-    llm_service = LLMService(
+@lru_cache(maxsize=1)
+def _get_llm_service() -> LLMService:
+    """Get the process-wide LLM service so its SDK client is reused."""
+    return LLMService(
         provider=settings.LLM_PROVIDER,
         model_name=settings.LLM_MODEL,
         api_key=settings.OPENAI_API_KEY if settings.LLM_PROVIDER == "openai" else None,
         base_url=settings.LLM_BASE_URL,
     )
 
-    # Create and return chat service
+
+async def get_chat_service(db: Session = Depends(get_db)) -> ChatService:
+    """Get chat service with dependencies.
+
+    Only the vector search service is request-scoped (it needs the session);
+    the embedding and LLM services are built once per process.
+    """
+    vector_search_service = VectorSearchService(
+        db=db,
+        embedding_service=get_embedding_service(),
+    )
+
     return ChatService(
         db=db,
         vector_search_service=vector_search_service,
-        llm_service=llm_service,
+        llm_service=_get_llm_service(),
     )
 
 
@@ -74,7 +75,9 @@ async def chat(
     try:
         logger.info(f"Chat request from user {current_user.id}: {request.question[:100]}")
 
-        response = chat_service.chat(
+        # Retrieval and LLM calls are blocking; keep them off the event loop
+        response = await run_in_threadpool(
+            chat_service.chat,
             question=request.question,
             user_id=current_user.id,
             conversation_history=request.conversation_history,
@@ -84,6 +87,11 @@ async def chat(
         logger.info(f"Chat response generated with {len(response.sources)} sources")
         return response
 
+    except CartularyException as e:
+        # Expected application errors: log without building a traceback
+        logger.warning(f"Chat request rejected: {e.message}")
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
     except Exception as e:
         logger.error(f"Chat endpoint error: {e}", exc_info=True)
         raise HTTPException(
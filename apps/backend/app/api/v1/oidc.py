@@ -6,7 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-import redis
+import httpx
+import jwt
+import redis.asyncio as aioredis
 
 from app.database import get_db
 from app.config import settings
@@ -47,31 +49,41 @@ class OIDCStateStore:
 
     STATE_PREFIX = "oidc:state:"
     STATE_TTL = 600  # 10 minutes
+    MAX_CONNECTIONS = 50
 
     def __init__(self):
-        self._redis: Optional[redis.Redis] = None
-
-    def _get_redis(self) -> redis.Redis:
-        """Lazy initialization of Redis connection."""
-        if self._redis is None:
-            self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
-        return self._redis
-
-    def create_state(self) -> str:
+        self._pool: Optional[aioredis.ConnectionPool] = None
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Get an async Redis client backed by a shared connection pool."""
+        if self._pool is None:
+            self._pool = aioredis.ConnectionPool.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                max_connections=self.MAX_CONNECTIONS,
+            )
+        return aioredis.Redis(connection_pool=self._pool)
+
+    async def create_state(self) -> str:
         """Create a new state token and store in Redis."""
-        state = secrets.token_urlsafe(32)
-        key = f"{self.STATE_PREFIX}{state}"
-        self._get_redis().setex(key, self.STATE_TTL, "1")
+        redis_client = self._get_redis()
+        while True:
+            state = secrets.token_urlsafe(32)
+            key = f"{self.STATE_PREFIX}{state}"
+            # SET NX EX stores with TTL in one round-trip and refuses to overwrite
+            # an existing token; regenerate on the (astronomically unlikely) collision
+            if await redis_client.set(key, "1", ex=self.STATE_TTL, nx=True):
+                break
         logger.debug(f"Created OIDC state token: {state[:8]}...")
         return state
 
-    def verify_state(self, state: str) -> bool:
+    async def verify_state(self, state: str) -> bool:
         """Verify and consume a state token (atomic operation)."""
         key = f"{self.STATE_PREFIX}{state}"
-        # Use DELETE which returns the number of keys deleted (1 if existed, 0 if not)
-        # This is atomic - only one request can successfully delete the key
-        deleted = self._get_redis().delete(key)
-        result = deleted > 0
+        # GETDEL (Redis >= 6.2) reads and removes the key atomically, so only
+        # one request can ever consume a given state token
+        value = await self._get_redis().execute_command("GETDEL", key)
+        result = value is not None
         logger.debug(f"Verified OIDC state token: {state[:8]}... = {result}")
         return result
 
@@ -114,7 +126,7 @@ async def oidc_login():
 
     try:
         # Generate state for CSRF protection
-        state = state_store.create_state()
+        state = await state_store.create_state()
 
         # Get authorization URL
         authorization_url, _ = oidc_service.get_authorization_url(state)
@@ -148,7 +160,7 @@ async def oidc_callback(
         )
 
     # Verify state to prevent CSRF
-    if not state_store.verify_state(state):
+    if not await state_store.verify_state(state):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid state parameter"
@@ -175,6 +187,20 @@ async def oidc_callback(
             refresh_token=refresh_token
         )
 
+    except httpx.HTTPStatusError as e:
+        # Provider rejected the code/token (expired, reused, wrong client) - expected, no traceback
+        logger.warning(f"OIDC provider rejected callback: {e.response.status_code}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="OIDC provider rejected the authorization code"
+        )
+    except ValueError as e:
+        # Missing claims or auto-provisioning disabled
+        logger.warning(f"OIDC callback rejected: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"OIDC authentication failed: {str(e)}"
+        )
     except Exception as e:
         logger.error(f"OIDC callback failed: {e}", exc_info=True)
         raise HTTPException(
@@ -206,21 +232,17 @@ async def exchange_oidc_token(
         # For mobile apps, try to decode and verify the ID token directly first
         # This is more reliable than calling userinfo with a token from a different client
         try:
-            import jwt
-            from jwt import PyJWKClient
-
-            # Get the JWKS URL from OIDC discovery
+            # Get the JWKS URL from OIDC discovery (cached in-process)
             metadata = await oidc_service.get_provider_metadata()
             jwks_uri = metadata.get('jwks_uri')
 
             if jwks_uri:
-                # Verify and decode the ID token
-                jwks_client = PyJWKClient(jwks_uri)
-                signing_key = jwks_client.get_signing_key_from_jwt(request.id_token)
+                # Verify and decode the ID token (signing key memoized by kid)
+                signing_key = oidc_service.get_signing_key(jwks_uri, request.id_token)
 
                 userinfo = jwt.decode(
                     request.id_token,
-                    signing_key.key,
+                    signing_key,
                     algorithms=["RS256"],
                     audience=settings.OIDC_MOBILE_CLIENT_ID or settings.OIDC_CLIENT_ID,
                     options={"verify_exp": True}
@@ -250,14 +272,25 @@ async def exchange_oidc_token(
             refresh_token=refresh_token
         )
 
+    except httpx.HTTPStatusError as e:
+        # Userinfo fallback rejected the access token - an ordinary bad-token case
+        logger.warning(
+            f"OIDC provider rejected the access token ({e.response.status_code}) - "
+            "check token validity and scopes"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="OIDC provider rejected the access token"
+        )
+    except ValueError as e:
+        # Missing claims or auto-provisioning disabled
+        logger.warning(f"OIDC token exchange rejected: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"OIDC token exchange failed: {str(e)}"
+        )
     except Exception as e:
         logger.error(f"OIDC token exchange failed: {e}", exc_info=True)
-
-        # Check if it's a userinfo fetch error
-        error_msg = str(e)
-        if "401" in error_msg or "Unauthorized" in error_msg:
-            logger.error("OIDC provider rejected the access token - check token validity and scopes")
-
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"OIDC token exchange failed: {str(e)}"
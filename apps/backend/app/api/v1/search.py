@@ -1,11 +1,14 @@
 """Search API endpoints."""
-from typing import List
+from typing import Iterator, List
 from enum import Enum
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.database import SessionLocal
 from app.dependencies import get_current_user, get_db
 from app.models.user import User
 from app.schemas.document import DocumentResponse
@@ -32,12 +35,12 @@ class SearchResult(BaseModel):
     matched_chunk: str | None = None
 
 
-def get_search_service(db: Session = Depends(get_db)) -> SearchService:
+async def get_search_service(db: Session = Depends(get_db)) -> SearchService:
     """Dependency to get search service."""
     return SearchService(db)
 
 
-def get_vector_search_service(db: Session = Depends(get_db)) -> VectorSearchService:
+async def get_vector_search_service(db: Session = Depends(get_db)) -> VectorSearchService:
     """Dependency to get vector search service."""
     return VectorSearchService(db)
 
@@ -109,12 +112,78 @@ async def advanced_search(
     - **semantic**: Vector similarity search (understands meaning)
     - **hybrid**: Combines both methods using Reciprocal Rank Fusion (best quality)
     """
-    search_results = []
+    return list(
+        _iter_advanced_results(
+            q,
+            mode,
+            limit,
+            similarity_threshold,
+            current_user.id,
+            search_service,
+            vector_search_service,
+        )
+    )
+
+
+@router.get("/advanced/stream")
+async def advanced_search_stream(
+    q: str = Query(..., description="Search query"),
+    mode: SearchMode = Query(SearchMode.HYBRID, description="Search mode"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
+    similarity_threshold: float = Query(
+        0.3,
+        ge=0.0,
+        le=1.0,
+        description="Minimum similarity score (0-1) for semantic/hybrid search. 0.3=default, 0.5=stricter, 0.0=no filter"
+    ),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Streaming variant of /advanced that emits one SearchResult per line (NDJSON).
+
+    Results are written as soon as their highlights are built, so clients get the
+    first hit without waiting for snippet extraction over every document.
+    Parameters and modes are the same as /advanced.
+    """
+    user_id = current_user.id
+
+    def generate() -> Iterator[str]:
+        # The stream outlives the request dependencies, so it owns its session
+        db = SessionLocal()
+        try:
+            for result in _iter_advanced_results(
+                q,
+                mode,
+                limit,
+                similarity_threshold,
+                user_id,
+                SearchService(db),
+                VectorSearchService(db),
+            ):
+                yield result.model_dump_json() + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _iter_advanced_results(
+    q: str,
+    mode: SearchMode,
+    limit: int,
+    similarity_threshold: float,
+    user_id: UUID,
+    search_service: SearchService,
+    vector_search_service: VectorSearchService,
+) -> Iterator[SearchResult]:
+    """Run an advanced search and yield results with highlights, one at a time."""
+    prepared = search_service.prepare_query(q)
+    highlighter = prepared.highlighter
 
     if mode == SearchMode.SEMANTIC:
         # Pure semantic search
         results = vector_search_service.vector_search(
-            q, current_user.id, limit=limit, similarity_threshold=similarity_threshold
+            q, user_id, limit=limit, similarity_threshold=similarity_threshold
         )
         # results is List[Tuple[Document, float, str]]
         for doc, score, chunk_text in results:
@@ -122,22 +191,20 @@ async def advanced_search(
             if chunk_text:
                 # Truncate chunk if too long for display and highlight terms
                 display_chunk = chunk_text[:300] + "..." if len(chunk_text) > 300 else chunk_text
-                display_chunk = search_service._highlight_terms(display_chunk, q.split())
+                display_chunk = search_service._highlight_terms(display_chunk, highlighter)
                 highlights.append(display_chunk)
             
-            search_results.append(
-                SearchResult(
-                    document=DocumentResponse.model_validate(doc),
-                    score=score,
-                    highlights=highlights,
-                    matched_chunk=chunk_text
-                )
+            yield SearchResult(
+                document=DocumentResponse.model_validate(doc),
+                score=score,
+                highlights=highlights,
+                matched_chunk=chunk_text
             )
 
     elif mode == SearchMode.HYBRID:
         # Hybrid search with RRF
         results = vector_search_service.hybrid_search(
-            q, current_user.id, limit=limit, similarity_threshold=similarity_threshold
+            q, user_id, limit=limit, similarity_threshold=similarity_threshold
         )
         # results is List[Tuple[Document, float, Optional[str]]]
         for doc, score, chunk_text in results:
@@ -146,40 +213,34 @@ async def advanced_search(
             # Add semantic chunk if available (with highlighting)
             if chunk_text:
                 display_chunk = chunk_text[:300] + "..." if len(chunk_text) > 300 else chunk_text
-                display_chunk = search_service._highlight_terms(display_chunk, q.split())
+                display_chunk = search_service._highlight_terms(display_chunk, highlighter)
                 highlights.append(display_chunk)
             
             # Add keyword snippet from OCR text (already highlighted by extract_snippet)
             if doc.ocr_text:
-                snippets = search_service.extract_snippet(doc.ocr_text, q, context_chars=150, max_snippets=1)
+                snippets = search_service.extract_snippet(doc.ocr_text, prepared, context_chars=150, max_snippets=1)
                 highlights.extend(snippets)
             
-            search_results.append(
-                SearchResult(
-                    document=DocumentResponse.model_validate(doc),
-                    score=score,
-                    highlights=highlights,
-                    matched_chunk=chunk_text
-                )
+            yield SearchResult(
+                document=DocumentResponse.model_validate(doc),
+                score=score,
+                highlights=highlights,
+                matched_chunk=chunk_text
             )
 
     else:
         # Full-text search (default)
-        docs = search_service.search_documents(q, current_user.id, skip=0, limit=limit)
+        docs = search_service.search_documents(q, user_id, skip=0, limit=limit)
         for doc in docs:
             highlights = []
             # Extract snippets from OCR text
             if doc.ocr_text:
-                snippets = search_service.extract_snippet(doc.ocr_text, q, context_chars=150, max_snippets=2)
+                snippets = search_service.extract_snippet(doc.ocr_text, prepared, context_chars=150, max_snippets=2)
                 highlights.extend(snippets)
             
-            search_results.append(
-                SearchResult(
-                    document=doc,
-                    score=1.0,
-                    highlights=highlights,
-                    matched_chunk=None
-                )
+            yield SearchResult(
+                document=doc,
+                score=1.0,
+                highlights=highlights,
+                matched_chunk=None
             )
-
-    return search_results
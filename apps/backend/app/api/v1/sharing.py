@@ -1,16 +1,18 @@
 """Document sharing API endpoints."""
-from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from app.core.permissions import (
     PermissionLevel,
     get_permission_service,
     PermissionService,
-    require_document_access
+    require_document_access,
+    share_is_active
 )
 from app.dependencies import get_current_user
 from app.database import get_db
@@ -27,6 +29,42 @@ from app.schemas.sharing import (
 router = APIRouter()
 
 
+def _get_share_with_document(
+    db: Session, share_id: UUID, user: User
+) -> Tuple[DocumentShare, Document, Optional[DocumentShare]]:
+    """
+    Load a share, its document and the user's own share of that document in one query.
+
+    The third element is the user's unexpired share (or None), letting callers
+    check the user's access to the document without another lookup.
+
+    Raises:
+        HTTPException: If the share does not exist
+    """
+    user_share = aliased(DocumentShare)
+    row = (
+        db.query(DocumentShare, Document, user_share)
+        .join(Document, Document.id == DocumentShare.document_id)
+        .outerjoin(
+            user_share,
+            and_(
+                user_share.document_id == Document.id,
+                user_share.shared_with_user_id == user.id,
+                share_is_active(user_share)
+            )
+        )
+        .filter(DocumentShare.id == share_id)
+        .first()
+    )
+    if not row:
+        # document_id is a non-null cascading FK, so a missing document means no share
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Share not found"
+        )
+    return row
+
+
 @router.get("/documents/{document_id}/shares", response_model=List[DocumentShareResponse])
 async def list_document_shares(
     document_id: UUID,
@@ -63,39 +101,42 @@ async def create_document_share(
 
     Requires admin access to the document.
     """
-    # Verify shared_with user exists
-    shared_with_user = db.query(User).filter(User.id == share_data.shared_with_user_id).first()
-    if not shared_with_user:
+    # Validate permission level
+    if share_data.permission_level not in [
+        PermissionLevel.READ,
+        PermissionLevel.WRITE,
+        PermissionLevel.ADMIN
+    ]:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User to share with not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid permission level. Must be 'read', 'write', or 'admin'"
         )
 
-    # Check if share already exists
-    existing_share = (
-        db.query(DocumentShare)
-        .filter(
-            DocumentShare.document_id == document_id,
-            DocumentShare.shared_with_user_id == share_data.shared_with_user_id
+    # Verify shared_with user exists and check for an existing share in one query
+    row = (
+        db.query(User.id, DocumentShare.id)
+        .outerjoin(
+            DocumentShare,
+            and_(
+                DocumentShare.document_id == document_id,
+                DocumentShare.shared_with_user_id == User.id
+            )
         )
+        .filter(User.id == share_data.shared_with_user_id)
         .first()
     )
 
-    if existing_share:
+    if not row:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Document is already shared with this user"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User to share with not found"
         )
 
-    # Validate permission level
-    if share_data.permission_level not in [
-        PermissionLevel.READ,
-        PermissionLevel.WRITE,
-        PermissionLevel.ADMIN
-    ]:
+    _, existing_share_id = row
+    if existing_share_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid permission level. Must be 'read', 'write', or 'admin'"
+            detail="Document is already shared with this user"
         )
 
     # Create share
@@ -108,7 +149,15 @@ async def create_document_share(
     )
 
     db.add(db_share)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request created the same share after our check
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Document is already shared with this user"
+        )
     db.refresh(db_share)
 
     return db_share
@@ -127,23 +176,12 @@ async def update_document_share(
 
     Requires admin access to the document.
     """
-    share = db.query(DocumentShare).filter(DocumentShare.id == share_id).first()
-    if not share:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Share not found"
-        )
-
-    # Get document
-    document = db.query(Document).filter(Document.id == share.document_id).first()
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    share, document, user_share = _get_share_with_document(db, share_id, current_user)
 
     # Check admin access to document
-    if not permission_service.can_access_document(current_user, document, PermissionLevel.ADMIN):
+    if not permission_service.check_document_access(
+        current_user, document, user_share, PermissionLevel.ADMIN
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions to modify this share"
@@ -183,23 +221,12 @@ async def delete_document_share(
 
     Requires admin access to the document.
     """
-    share = db.query(DocumentShare).filter(DocumentShare.id == share_id).first()
-    if not share:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Share not found"
-        )
-
-    # Get document
-    document = db.query(Document).filter(Document.id == share.document_id).first()
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    share, document, user_share = _get_share_with_document(db, share_id, current_user)
 
     # Check admin access to document
-    if not permission_service.can_access_document(current_user, document, PermissionLevel.ADMIN):
+    if not permission_service.check_document_access(
+        current_user, document, user_share, PermissionLevel.ADMIN
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions to revoke this share"
@@ -221,18 +248,15 @@ async def list_shared_documents(
 
     Returns documents with share information.
     """
-    from sqlalchemy import and_
-
-    # Get shares for current user that haven't expired
+    # Get shares for current user that haven't expired, loading each share's
+    # document (and its tags for the response) in the same round-trips
     shares = (
         db.query(DocumentShare)
+        .options(joinedload(DocumentShare.document).selectinload(Document.tags))
         .filter(
             and_(
                 DocumentShare.shared_with_user_id == current_user.id,
-                or_(
-                    DocumentShare.expires_at.is_(None),
-                    DocumentShare.expires_at > datetime.utcnow()
-                )
+                share_is_active()
             )
         )
         .offset(skip)
@@ -243,10 +267,9 @@ async def list_shared_documents(
     # Build response with document and share info
     result = []
     for share in shares:
-        document = db.query(Document).filter(Document.id == share.document_id).first()
-        if document:
+        if share.document:
             result.append({
-                "document": document,
+                "document": share.document,
                 "share": share
             })
 
@@ -1,100 +1,120 @@
 """WebSocket endpoint for real-time updates."""
 import asyncio
+import json
 import logging
-from typing import Set
+from typing import List, Set, Union
 
-import redis.asyncio as aioredis
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
-from jose import JWTError, jwt
 
-from app.config import settings
+from app.core.security import decode_token
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["websocket"])
 
 REDIS_CHANNEL = "cartulary:events"
 
+# Seconds of client silence before the server sends a ping
+HEARTBEAT_INTERVAL = 60.0
+
+# Heartbeat payload never changes, so encode it once instead of per ping
+_PING_FRAME = json.dumps({"type": "ping"})
+_PING_BYTES = _PING_FRAME.encode("utf-8")
+
 
 class ConnectionManager:
     """Manage WebSocket connections."""
 
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
-        self._redis_task: asyncio.Task = None
-        self._redis_client = None
-
-    async def connect(self, websocket: WebSocket):
+        # Copy-on-write list: connect/disconnect replace it, so broadcast can fan out
+        # over the current list without copying it, even if clients come and go
+        # while sends are in flight
+        self.active_connections: List[WebSocket] = []
+        # Subset of active_connections that asked for binary frames
+        self.binary_connections: Set[WebSocket] = set()
+
+    async def connect(self, websocket: WebSocket, binary: bool = False):
         await websocket.accept()
-        self.active_connections.add(websocket)
+        self.active_connections = self.active_connections + [websocket]
+        if binary:
+            self.binary_connections.add(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
-        # Start Redis subscriber if this is the first connection
-        if self._redis_task is None or self._redis_task.done():
-            self._redis_task = asyncio.create_task(self._redis_subscriber())
-
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.discard(websocket)
+        if websocket in self.active_connections:
+            self.active_connections = [c for c in self.active_connections if c is not websocket]
+        self.binary_connections.discard(websocket)
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def broadcast(self, message: str):
-        """Broadcast message to all connected clients."""
+    async def broadcast(self, message: Union[str, bytes]):
+        """Broadcast message to all connected clients.
+
+        Args:
+            message: JSON event, either already UTF-8 encoded (as received from
+                Redis) or as text. It is converted at most once per broadcast:
+                binary clients get the bytes, text clients get the decoded str.
+        """
         if not self.active_connections:
             return
-        logger.info(f"Broadcasting to {len(self.active_connections)} connections: {message[:100]}...")
-        dead_connections = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-                logger.debug("Message sent successfully to client")
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
-                dead_connections.add(connection)
-
-        # Clean up dead connections
+        # Skip building the preview string unless it will actually be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Broadcasting to {len(self.active_connections)} connections: {message[:100]}...")
+
+        text = data = None
+        if isinstance(message, bytes):
+            data = message
+            if len(self.binary_connections) < len(self.active_connections):
+                text = message.decode("utf-8")
+        else:
+            text = message
+            if self.binary_connections:
+                data = message.encode("utf-8")
+
+        # Fan out concurrently so one slow client bounds latency instead of the sum
+        connections = self.active_connections
+        results = await asyncio.gather(
+            *(
+                connection.send_bytes(data)
+                if connection in self.binary_connections
+                else connection.send_text(text)
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
+
+        dead_connections = []
+        for connection, result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to send to WebSocket: {result}")
+                dead_connections.append(connection)
+
+        # Clean up dead connections (rare, so the list is only rebuilt then)
         if dead_connections:
             logger.info(f"Removing {len(dead_connections)} dead connections")
-            self.active_connections -= dead_connections
-
-    async def _redis_subscriber(self):
-        """Subscribe to Redis pub/sub and broadcast messages to WebSocket clients."""
-        logger.info("Starting Redis pub/sub subscriber...")
-        try:
-            self._redis_client = await aioredis.from_url(
-                settings.REDIS_URL, decode_responses=True
-            )
-            pubsub = self._redis_client.pubsub()
-            await pubsub.subscribe(REDIS_CHANNEL)
-            logger.info(f"Subscribed to Redis channel: {REDIS_CHANNEL}")
-
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    logger.info(f"Received Redis message: {message['data'][:100]}...")
-                    await self.broadcast(message["data"])
-        except asyncio.CancelledError:
-            logger.info("Redis subscriber cancelled")
-        except Exception as e:
-            logger.error(f"Redis subscriber error: {e}")
-        finally:
-            if self._redis_client:
-                await self._redis_client.close()
-                self._redis_client = None
+            self.active_connections = [
+                c for c in self.active_connections if c not in dead_connections
+            ]
+            self.binary_connections.difference_update(dead_connections)
 
 
 manager = ConnectionManager()
 
 
 async def verify_token(token: str) -> dict:
-    """Verify JWT token and return payload."""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
-        return None
+    """Verify JWT token and return payload (cached by decode_token)."""
+    return decode_token(token)
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, token: str = Query(...)):
-    """WebSocket endpoint for real-time updates."""
+async def websocket_endpoint(
+    websocket: WebSocket,
+    token: str = Query(...),
+    binary: bool = Query(False, description="Receive events as binary (UTF-8 JSON) frames"),
+):
+    """WebSocket endpoint for real-time updates.
+
+    Events are sent as text frames by default. Clients that pass ``binary=true``
+    get the Redis payload forwarded as-is in binary frames, skipping the decode.
+    """
     # Verify authentication
     payload = await verify_token(token)
     if not payload:
@@ -104,17 +124,25 @@ async def websocket_endpoint(websocket: WebSocket, token: str = Query(...)):
     user_id = payload.get("sub")
     logger.info(f"WebSocket connected: user={user_id}")
 
-    await manager.connect(websocket)
+    await manager.connect(websocket, binary=binary)
 
     try:
         # Keep connection alive with heartbeat
         while True:
             try:
-                # Wait for pong or timeout
-                await asyncio.wait_for(websocket.receive_text(), timeout=60.0)
-            except asyncio.TimeoutError:
-                # Send ping
-                await websocket.send_json({"type": "ping"})
+                # Wait for pong or timeout. asyncio.timeout() sets a deadline on the
+                # current task instead of wrapping receive in a new Task the way
+                # wait_for() does. Raw receive() accepts text or binary pongs.
+                async with asyncio.timeout(HEARTBEAT_INTERVAL):
+                    message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+            except TimeoutError:
+                # Send ping in the same frame type as events
+                if binary:
+                    await websocket.send_bytes(_PING_BYTES)
+                else:
+                    await websocket.send_text(_PING_FRAME)
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected: user={user_id}")
     except Exception as e:
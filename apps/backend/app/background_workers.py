@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from typing import List
 
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 
 logger = logging.getLogger(__name__)
 
@@ -98,8 +99,25 @@ worker_manager = BackgroundWorkerManager()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """FastAPI lifespan context manager for background workers."""
-    # Startup
+    """FastAPI lifespan context manager for startup checks and background workers."""
+    # Startup (on_event("startup") handlers don't run when a lifespan is given)
+    from app.core.startup import startup_checks
+    from app.services.embedding_service import preload_embedding_model
+
+    try:
+        startup_checks()
+    except Exception as e:
+        logger.error(f"Startup validation failed: {e}")
+        # Log the error but don't prevent startup (database might not be ready yet)
+        # The validation will run again on first use
+
+    # Load a local embedding model now so the first search or chat request doesn't
+    # wait for it; off the event loop since loading blocks for seconds
+    try:
+        await run_in_threadpool(preload_embedding_model)
+    except Exception as e:
+        logger.error(f"Embedding model preload failed: {e}")
+
     logger.info("Starting background workers...")
     await worker_manager.start_all()
 
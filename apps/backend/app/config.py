@@ -2,7 +2,7 @@
 import json
 from typing import Any, List, Optional
 
-from pydantic import PostgresDsn, field_validator
+from pydantic import PostgresDsn, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -42,23 +42,12 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12  # Hashes below this cost are upgraded on next login
+    FIELD_ENCRYPTION_KEY: Optional[str] = None  # urlsafe base64, 32 bytes; derived from SECRET_KEY if unset
 
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
 
-    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
-    @classmethod
-    def assemble_cors_origins(cls, v: Any) -> List[str]:
-        """Parse CORS origins from JSON string or list."""
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return [i.strip() for i in v.split(",")]
-        elif isinstance(v, list):
-            return v
-        return []
-
     # Vision OCR (Phase 2 - LLM-based)
     OCR_ENABLED: bool = False
     VISION_OCR_MODEL: str = "minicpm-v"  # Ollama vision model for text extraction
@@ -93,17 +82,6 @@ class Settings(BaseSettings):
     OIDC_CLAIM_NAME: str = "name"  # OIDC claim for full name
     OIDC_CLAIM_GROUPS: Optional[str] = None  # Optional OIDC claim for groups/roles
 
-    @field_validator("OIDC_SCOPES", mode="before")
-    @classmethod
-    def parse_oidc_scopes(cls, v: Any) -> List[str]:
-        """Parse OIDC scopes from JSON string or list."""
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return [i.strip() for i in v.split(",") if i.strip()]
-        return v or ["openid", "profile", "email"]
-
     # Import Sources (Phase 6)
     WATCH_DIRECTORIES: List[str] = []
     IMAP_ENABLED: bool = False
@@ -114,16 +92,23 @@ class Settings(BaseSettings):
     IMAP_FOLDER: str = "INBOX"
     IMAP_PROCESSED_FOLDER: str = "Processed"
 
-    @field_validator("WATCH_DIRECTORIES", mode="before")
+    @field_validator(
+        "BACKEND_CORS_ORIGINS", "OIDC_SCOPES", "WATCH_DIRECTORIES", mode="before"
+    )
     @classmethod
-    def parse_watch_directories(cls, v: Any) -> List[str]:
-        """Parse watch directories from JSON string or list."""
+    def parse_list(cls, v: Any, info: ValidationInfo) -> List[str]:
+        """Parse list settings from JSON string, comma-separated string, or list.
+
+        Empty values fall back to the field's default.
+        """
         if isinstance(v, str):
             try:
                 return json.loads(v)
             except json.JSONDecodeError:
                 return [i.strip() for i in v.split(",") if i.strip()]
-        return v or []
+        if isinstance(v, list) and v:
+            return v
+        return list(cls.model_fields[info.field_name].default)
 
 
 settings = Settings()
@@ -0,0 +1,77 @@
+"""Encryption of sensitive column values at rest."""
+import base64
+import os
+from functools import lru_cache
+from typing import Optional
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from app.config import settings
+
+# Stored layout: version byte + 12-byte nonce + AES-GCM ciphertext and tag
+_FORMAT_VERSION = b"\x01"
+_NONCE_SIZE = 12
+
+
+@lru_cache(maxsize=1)
+def _get_cipher() -> AESGCM:
+    """
+    Build the AES-256-GCM cipher for column encryption.
+
+    Uses FIELD_ENCRYPTION_KEY (urlsafe base64 of 32 bytes) when set, otherwise a
+    key derived from SECRET_KEY with HKDF.
+    """
+    if settings.FIELD_ENCRYPTION_KEY:
+        key = base64.urlsafe_b64decode(settings.FIELD_ENCRYPTION_KEY)
+        if len(key) != 32:
+            raise ValueError("FIELD_ENCRYPTION_KEY must be 32 bytes (urlsafe base64 encoded)")
+    else:
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"cartulary-field-encryption",
+        ).derive(settings.SECRET_KEY.encode("utf-8"))
+    return AESGCM(key)
+
+
+def encrypt_str(value: str) -> bytes:
+    """Encrypt a string for storage."""
+    nonce = os.urandom(_NONCE_SIZE)
+    return _FORMAT_VERSION + nonce + _get_cipher().encrypt(nonce, value.encode("utf-8"), None)
+
+
+def decrypt_str(data: bytes) -> str:
+    """
+    Decrypt a value produced by encrypt_str.
+
+    Raises:
+        ValueError: If the data has an unknown format
+        cryptography.exceptions.InvalidTag: If the key is wrong or data was tampered with
+    """
+    data = bytes(data)
+    if data[:1] != _FORMAT_VERSION:
+        raise ValueError("Unknown encrypted value format")
+    nonce = data[1:1 + _NONCE_SIZE]
+    return _get_cipher().decrypt(nonce, data[1 + _NONCE_SIZE:], None).decode("utf-8")
+
+
+class EncryptedString(TypeDecorator):
+    """String column stored encrypted with AES-GCM as bytea."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return encrypt_str(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return decrypt_str(value)
@@ -1,14 +1,17 @@
 """Permission checking and authorization helpers."""
 import logging
-from typing import Optional, List
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, List
 from uuid import UUID
 from datetime import datetime
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, exists, func, inspect, or_
+from sqlalchemy.orm import Session, selectinload
 
 from app.database import get_db
-from app.models.user import User, Permission, Role
+from app.models.user import User, Permission, Role, role_permissions, user_roles
 from app.models.document import Document
 from app.models.sharing import DocumentShare
 
@@ -23,32 +26,85 @@ class PermissionLevel:
     ADMIN = "admin"
 
 
+# Permission hierarchy: admin > write > read. Built once at import rather than
+# on every access check; unknown levels rank 0.
+_LEVEL_RANK = {
+    PermissionLevel.READ: 1,
+    PermissionLevel.WRITE: 2,
+    PermissionLevel.ADMIN: 3,
+}
+
+
+def is_superuser(user: User) -> bool:
+    """
+    Return the user's superuser flag, preferring the per-request snapshot.
+
+    get_current_user stores the flag on the user as _is_super_cached, so checks
+    made after a commit (which expires ORM attributes) don't trigger a refresh.
+    """
+    cached = getattr(user, "_is_super_cached", None)
+    if cached is not None:
+        return cached
+    return bool(user.is_superuser)
+
+
+def share_is_active(share=DocumentShare):
+    """
+    SQL condition for a share that has not expired.
+
+    expires_at is a naive UTC timestamp, so it is compared against the database
+    clock in UTC. Filtering in SQL means expired shares are never fetched.
+
+    Args:
+        share: DocumentShare entity or alias to build the condition for
+    """
+    return or_(
+        share.expires_at.is_(None),
+        share.expires_at > func.timezone("utc", func.now())
+    )
+
+
 class SystemPermissions:
-    """System-level permissions."""
+    """
+    System-level permissions.
+
+    Names are interned, and names loaded from the database are interned too
+    (see PermissionService._get_perm_set), so membership checks against a
+    user's permission set usually match by identity.
+    """
 
     # Document permissions
-    DOCUMENTS_READ = "documents:read"
-    DOCUMENTS_WRITE = "documents:write"
-    DOCUMENTS_DELETE = "documents:delete"
-    DOCUMENTS_SHARE = "documents:share"
+    DOCUMENTS_READ = sys.intern("documents:read")
+    DOCUMENTS_WRITE = sys.intern("documents:write")
+    DOCUMENTS_DELETE = sys.intern("documents:delete")
+    DOCUMENTS_SHARE = sys.intern("documents:share")
 
     # Tag permissions
-    TAGS_READ = "tags:read"
-    TAGS_WRITE = "tags:write"
-    TAGS_DELETE = "tags:delete"
+    TAGS_READ = sys.intern("tags:read")
+    TAGS_WRITE = sys.intern("tags:write")
+    TAGS_DELETE = sys.intern("tags:delete")
 
     # User permissions
-    USERS_READ = "users:read"
-    USERS_WRITE = "users:write"
-    USERS_DELETE = "users:delete"
+    USERS_READ = sys.intern("users:read")
+    USERS_WRITE = sys.intern("users:write")
+    USERS_DELETE = sys.intern("users:delete")
 
     # Role permissions
-    ROLES_READ = "roles:read"
-    ROLES_WRITE = "roles:write"
-    ROLES_DELETE = "roles:delete"
+    ROLES_READ = sys.intern("roles:read")
+    ROLES_WRITE = sys.intern("roles:write")
+    ROLES_DELETE = sys.intern("roles:delete")
 
     # Admin permissions
-    ADMIN_ACCESS = "admin:access"
+    ADMIN_ACCESS = sys.intern("admin:access")
+
+    # Every name above, for O(1) validity checks (filled in below)
+    ALL: FrozenSet[str] = frozenset()
+
+
+SystemPermissions.ALL = frozenset(
+    value for name, value in vars(SystemPermissions).items()
+    if name.isupper() and isinstance(value, str)
+)
 
 
 class PermissionService:
@@ -56,6 +112,66 @@ class PermissionService:
 
     def __init__(self, db: Session):
         self.db = db
+        # Flattened permission names per user; the service is request-scoped,
+        # so this memo lives exactly as long as the request
+        self._perm_cache: Dict[UUID, FrozenSet[str]] = {}
+        # Active shares per user, keyed by document id; same request-long lifetime
+        self._share_cache: Dict[UUID, Dict[UUID, DocumentShare]] = {}
+
+    def _get_perm_set(self, user: User) -> FrozenSet[str]:
+        """
+        Get the names of all permissions granted to the user through their roles.
+
+        Args:
+            user: User to resolve permissions for
+
+        Returns:
+            Frozen set of permission names, computed once per user per service
+        """
+        perm_set = self._perm_cache.get(user.id)
+        if perm_set is None:
+            # One join over user_roles -> role_permissions instead of lazy-loading
+            # user.roles and then each role's permissions separately
+            rows = (
+                self.db.query(Permission.name)
+                .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+                .join(user_roles, user_roles.c.role_id == role_permissions.c.role_id)
+                .filter(user_roles.c.user_id == user.id)
+                .distinct()
+                .all()
+            )
+            perm_set = frozenset(sys.intern(name) for (name,) in rows)
+            self._perm_cache[user.id] = perm_set
+        return perm_set
+
+    def _get_user_shares(self, user: User) -> Dict[UUID, DocumentShare]:
+        """
+        Get the user's unexpired shares, keyed by document ID.
+
+        Loaded with one query on first use and reused for every later share
+        check for the same user, so checking M documents costs one query, not M.
+
+        Args:
+            user: User whose shares to load
+
+        Returns:
+            Mapping of document ID to the user's share of it
+        """
+        shares = self._share_cache.get(user.id)
+        if shares is None:
+            shares = {
+                share.document_id: share
+                for share in (
+                    self.db.query(DocumentShare)
+                    .filter(
+                        DocumentShare.shared_with_user_id == user.id,
+                        share_is_active()
+                    )
+                    .all()
+                )
+            }
+            self._share_cache[user.id] = shares
+        return shares
 
     def user_has_permission(self, user: User, permission_name: str) -> bool:
         """
@@ -69,16 +185,10 @@ class PermissionService:
             True if user has permission, False otherwise
         """
         # Superusers have all permissions
-        if user.is_superuser:
+        if is_superuser(user):
             return True
 
-        # Check user's roles for this permission
-        for role in user.roles:
-            for permission in role.permissions:
-                if permission.name == permission_name:
-                    return True
-
-        return False
+        return permission_name in self._get_perm_set(user)
 
     def user_has_any_permission(self, user: User, permission_names: List[str]) -> bool:
         """
@@ -91,14 +201,10 @@ class PermissionService:
         Returns:
             True if user has at least one permission, False otherwise
         """
-        if user.is_superuser:
+        if is_superuser(user):
             return True
 
-        for permission_name in permission_names:
-            if self.user_has_permission(user, permission_name):
-                return True
-
-        return False
+        return not self._get_perm_set(user).isdisjoint(permission_names)
 
     def user_has_all_permissions(self, user: User, permission_names: List[str]) -> bool:
         """
@@ -111,14 +217,10 @@ class PermissionService:
         Returns:
             True if user has all permissions, False otherwise
         """
-        if user.is_superuser:
+        if is_superuser(user):
             return True
 
-        for permission_name in permission_names:
-            if not self.user_has_permission(user, permission_name):
-                return False
-
-        return True
+        return self._get_perm_set(user).issuperset(permission_names)
 
     def can_access_document(
         self,
@@ -137,8 +239,103 @@ class PermissionService:
         Returns:
             True if user has access, False otherwise
         """
+        # Superusers, owners and public reads need no share lookup
+        if self._has_direct_access(user, document, required_level):
+            return True
+
+        # Check document shares, reusing the collection if the caller already loaded it
+        if "shares" not in inspect(document).unloaded:
+            now = datetime.utcnow()
+            share = next(
+                (
+                    s for s in document.shares
+                    if s.shared_with_user_id == user.id
+                    and not (s.expires_at and s.expires_at < now)
+                ),
+                None
+            )
+        else:
+            share = self._get_user_shares(user).get(document.id)
+
+        return self._share_grants(share, required_level)
+
+    def check_document_access(
+        self,
+        user: User,
+        document: Document,
+        share: Optional[DocumentShare],
+        required_level: str = PermissionLevel.READ
+    ) -> bool:
+        """
+        Check document access when the user's share (if any) is already loaded.
+
+        Args:
+            user: User to check
+            document: Document to check access for
+            share: The user's unexpired share of this document, or None
+            required_level: Required permission level (read, write, admin)
+
+        Returns:
+            True if user has access, False otherwise
+        """
+        return (
+            self._has_direct_access(user, document, required_level)
+            or self._share_grants(share, required_level)
+        )
+
+    def bulk_can_access(
+        self,
+        user: User,
+        document_ids: Iterable[UUID],
+        required_level: str = PermissionLevel.READ
+    ) -> FrozenSet[UUID]:
+        """
+        Check access to many documents with a single query.
+
+        Use this instead of calling can_access_document per item when a caller
+        needs to filter a list of document IDs.
+
+        Args:
+            user: User to check
+            document_ids: IDs of documents to check
+            required_level: Required permission level (read, write, admin)
+
+        Returns:
+            IDs of existing documents the user can access at the required level
+        """
+        document_ids = list(document_ids)
+        if not document_ids:
+            return frozenset()
+
+        query = self.db.query(Document.id).filter(Document.id.in_(document_ids))
+
+        if not is_superuser(user):
+            required_rank = _LEVEL_RANK.get(required_level, 0)
+            allowed_levels = [level for level, rank in _LEVEL_RANK.items() if rank >= required_rank]
+
+            conditions = [
+                Document.owner_id == user.id,
+                DocumentShare.permission_level.in_(allowed_levels),
+            ]
+            if required_level == PermissionLevel.READ:
+                conditions.append(Document.is_public == True)
+
+            # At most one share per (document, user), so the join cannot duplicate rows
+            query = query.outerjoin(
+                DocumentShare,
+                and_(
+                    DocumentShare.document_id == Document.id,
+                    DocumentShare.shared_with_user_id == user.id,
+                    share_is_active()
+                )
+            ).filter(or_(*conditions))
+
+        return frozenset(document_id for (document_id,) in query.all())
+
+    def _has_direct_access(self, user: User, document: Document, required_level: str) -> bool:
+        """Check access that does not depend on shares (superuser, owner, public read)."""
         # Superusers have all access
-        if user.is_superuser:
+        if is_superuser(user):
             return True
 
         # Owner has all access
@@ -146,28 +343,20 @@ class PermissionService:
             return True
 
         # Check if document is public (read-only)
-        if document.is_public and required_level == PermissionLevel.READ:
-            return True
+        return bool(document.is_public) and required_level == PermissionLevel.READ
 
-        # Check document shares
-        share = (
-            self.db.query(DocumentShare)
-            .filter(
-                DocumentShare.document_id == document.id,
-                DocumentShare.shared_with_user_id == user.id
-            )
-            .first()
-        )
-
-        if share:
-            # Check if share has expired
-            if share.expires_at and share.expires_at < datetime.utcnow():
-                return False
+    def _share_grants(self, share: Optional[DocumentShare], required_level: str) -> bool:
+        """
+        Check whether a share grants at least the required level.
 
-            # Check permission level hierarchy
-            return self._check_permission_level(share.permission_level, required_level)
+        Callers load only unexpired shares (see share_is_active), so expiry is
+        not re-checked here.
+        """
+        if not share:
+            return False
 
-        return False
+        # Check permission level hierarchy
+        return self._check_permission_level(share.permission_level, required_level)
 
     def _check_permission_level(self, granted_level: str, required_level: str) -> bool:
         """
@@ -182,13 +371,7 @@ class PermissionService:
         Returns:
             True if granted level satisfies required level
         """
-        hierarchy = {
-            PermissionLevel.READ: 1,
-            PermissionLevel.WRITE: 2,
-            PermissionLevel.ADMIN: 3
-        }
-
-        return hierarchy.get(granted_level, 0) >= hierarchy.get(required_level, 0)
+        return _LEVEL_RANK.get(granted_level, 0) >= _LEVEL_RANK.get(required_level, 0)
 
     def get_accessible_documents_query(self, user: User):
         """
@@ -200,42 +383,48 @@ class PermissionService:
         Returns:
             SQLAlchemy query object
         """
-        from sqlalchemy import or_
-        from sqlalchemy.orm import joinedload
-
-        from sqlalchemy.orm import selectinload
-
         # Superusers see all documents
-        if user.is_superuser:
+        if is_superuser(user):
             return self.db.query(Document).options(selectinload(Document.tags))
 
+        # A correlated EXISTS lets Postgres stop at the first matching share per
+        # document, with no join row explosion to de-duplicate afterwards
+        shared_with_user = exists().where(
+            DocumentShare.document_id == Document.id,
+            DocumentShare.shared_with_user_id == user.id,
+            share_is_active()
+        )
+
         # Get documents where user is owner, document is public, or document is shared with user
         return (
             self.db.query(Document)
             .options(selectinload(Document.tags))
-            .outerjoin(DocumentShare, Document.id == DocumentShare.document_id)
             .filter(
                 or_(
                     Document.owner_id == user.id,
                     Document.is_public == True,
-                    DocumentShare.shared_with_user_id == user.id
+                    shared_with_user
                 )
             )
-            .distinct()
         )
 
 
 # Dependency functions for FastAPI
 
-def get_permission_service(db: Session = Depends(get_db)) -> PermissionService:
+async def get_permission_service(db: Session = Depends(get_db)) -> PermissionService:
     """Dependency to get permission service."""
     return PermissionService(db)
 
 
+@lru_cache(maxsize=None)
 def require_permission(permission_name: str):
     """
     Dependency factory to require a specific permission.
 
+    The dependency is built once per permission name and reused, so every route
+    requiring the same permission shares one callable and FastAPI resolves it at
+    most once per request.
+
     Usage:
         @router.get("/admin")
         async def admin_endpoint(
@@ -251,6 +440,10 @@ def require_permission(permission_name: str):
     """
     from app.dependencies import get_current_user
 
+    permission_name = sys.intern(permission_name)
+    if permission_name not in SystemPermissions.ALL:
+        logger.warning(f"require_permission: unknown system permission {permission_name!r}")
+
     async def check_permission(
         current_user: User = Depends(get_current_user),
         permission_service: PermissionService = Depends(get_permission_service)
@@ -277,6 +470,8 @@ def require_any_permission(permission_names: List[str]):
     """
     from app.dependencies import get_current_user
 
+    permission_names = [sys.intern(name) for name in permission_names]
+
     async def check_permissions(
         current_user: User = Depends(get_current_user),
         permission_service: PermissionService = Depends(get_permission_service)
@@ -304,7 +499,7 @@ def require_superuser():
     from app.dependencies import get_current_user
 
     async def check_superuser(current_user: User = Depends(get_current_user)) -> User:
-        if not current_user.is_superuser:
+        if not is_superuser(current_user):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Superuser access required"
@@ -342,21 +537,32 @@ def require_document_access(
         db: Session = Depends(get_db),
         permission_service: PermissionService = Depends(get_permission_service)
     ) -> Document:
-        # Get document with eagerly loaded tags
-        from sqlalchemy.orm import selectinload
-
-        document = db.query(Document).options(
-            selectinload(Document.tags)
-        ).filter(Document.id == document_id).first()
+        # Load the document (with tags) and the current user's share in one query
+        row = (
+            db.query(Document, DocumentShare)
+            .outerjoin(
+                DocumentShare,
+                and_(
+                    DocumentShare.document_id == Document.id,
+                    DocumentShare.shared_with_user_id == current_user.id,
+                    share_is_active()
+                )
+            )
+            .options(selectinload(Document.tags))
+            .filter(Document.id == document_id)
+            .first()
+        )
 
-        if not document:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Document not found"
             )
 
+        document, share = row
+
         # Check access
-        if not permission_service.can_access_document(current_user, document, required_level):
+        if not permission_service.check_document_access(current_user, document, share, required_level):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions for this document (requires {required_level})"
@@ -1,12 +1,26 @@
 """Security utilities for authentication and authorization."""
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
 
 from app.config import settings
 
+# Our tokens are a few hundred bytes; anything far larger is not one of ours
+MAX_TOKEN_LENGTH = 4096
+
+# Verified token payloads, keyed by the raw token, so a client making many calls
+# in a short window skips HMAC verification and JSON decoding. Entries never
+# outlive the token's "exp".
+TOKEN_CACHE_SIZE = 5000
+TOKEN_CACHE_TTL = 60
+_token_cache: "OrderedDict[str, Tuple[float, dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
@@ -17,12 +31,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    """Hash a password using bcrypt at the configured cost."""
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
 
+def _bcrypt_cost(hashed_password: str) -> Optional[int]:
+    """Extract the cost factor from a "$2b$<cost>$..." bcrypt hash."""
+    try:
+        return int(hashed_password.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash uses a lower cost.
+
+    Args:
+        plain_password: Password provided by the user
+        hashed_password: Stored bcrypt hash
+
+    Returns:
+        Tuple of (is_valid, new_hash). new_hash is set only when the password
+        is valid and the stored hash should be replaced.
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+
+    cost = _bcrypt_cost(hashed_password)
+    if cost is not None and cost < settings.BCRYPT_ROUNDS:
+        return True, get_password_hash(plain_password)
+    return True, None
+
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -75,14 +120,43 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
     """
     Decode and verify a JWT token.
 
+    Recently verified tokens are served from a process-local cache until the
+    earlier of TOKEN_CACHE_TTL seconds or the token's expiry.
+
     Args:
         token: The JWT token to decode
 
     Returns:
         Decoded token payload or None if invalid
     """
+    # Reject obviously malformed input before spending CPU on signature checks
+    if not token or len(token) > MAX_TOKEN_LENGTH or token.count(".") != 2:
+        return None
+
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            expires_at, payload = cached
+            if expires_at > now:
+                _token_cache.move_to_end(token)
+                # Copy so callers can't alter the cached payload
+                return dict(payload)
+            del _token_cache[token]
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+    except jwt.InvalidTokenError:
         return None
+
+    expires_at = now + TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+
+    with _token_cache_lock:
+        _token_cache[token] = (expires_at, payload)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+    return dict(payload)
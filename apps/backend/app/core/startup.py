@@ -1,5 +1,12 @@
 """Startup validation and initialization."""
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
@@ -8,11 +15,64 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Passing dimension checks are recorded here so that workers booting together
+# (uvicorn/gunicorn --workers N, Celery) query pg_attribute once, not N times.
+STARTUP_CACHE_PATH = os.path.join(tempfile.gettempdir(), "cartulary_startup.json")
+STARTUP_CACHE_TTL = 300  # seconds
+
+
+def _startup_cache_key() -> str:
+    """Fingerprint of the settings a cached dimension check is valid for."""
+    raw = f"{settings.DATABASE_URL}|{settings.EMBEDDING_DIMENSION}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _read_startup_cache() -> Optional[int]:
+    """Return the cached database dimension if a fresh, matching check exists."""
+    try:
+        with open(STARTUP_CACHE_PATH, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("key") != _startup_cache_key():
+        return None
+    if time.time() - cached.get("checked_at", 0) > STARTUP_CACHE_TTL:
+        return None
+    return cached.get("db_dimension")
+
+
+def _write_startup_cache(db_dimension: int) -> None:
+    """Record a passing dimension check (best effort)."""
+    tmp_path = f"{STARTUP_CACHE_PATH}.{os.getpid()}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "key": _startup_cache_key(),
+                "db_dimension": db_dimension,
+                "checked_at": time.time(),
+            }, f)
+        # Atomic rename so concurrent workers never read a partial file
+        os.replace(tmp_path, STARTUP_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write startup cache: {e}")
+
+
+def clear_startup_cache() -> None:
+    """Forget cached startup checks, e.g. after changing the vector column."""
+    try:
+        os.remove(STARTUP_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+
 
 def validate_embedding_dimension():
     """
     Validate that the database vector dimension matches the configured dimension.
 
+    A passing result is cached for STARTUP_CACHE_TTL seconds so other workers
+    starting at the same time can skip the query.
+
     Raises:
         ValueError: If dimensions don't match
         RuntimeError: If unable to check dimension
@@ -21,6 +81,14 @@ def validate_embedding_dimension():
         logger.info("Embeddings disabled, skipping dimension validation")
         return
 
+    cached_dimension = _read_startup_cache()
+    if cached_dimension == settings.EMBEDDING_DIMENSION:
+        logger.info(
+            f"✓ Embedding dimension validation passed (cached): "
+            f"{cached_dimension} dimensions ({settings.EMBEDDING_PROVIDER}/{settings.EMBEDDING_MODEL})"
+        )
+        return
+
     try:
         db = SessionLocal()
         try:
@@ -67,6 +135,8 @@ def validate_embedding_dimension():
                     f"  4. Regenerate all embeddings with the correct provider/dimension"
                 )
 
+            _write_startup_cache(db_dimension)
+
             logger.info(
                 f"✓ Embedding dimension validation passed: "
                 f"{db_dimension} dimensions ({settings.EMBEDDING_PROVIDER}/{settings.EMBEDDING_MODEL})"
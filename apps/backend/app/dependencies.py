@@ -30,7 +30,7 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+async def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     """
     Dependency for getting auth service.
 
@@ -113,6 +113,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Snapshot for permission checks (see app.core.permissions.is_superuser)
+    user._is_super_cached = bool(user.is_superuser)
+
     return user
 
 
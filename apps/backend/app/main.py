@@ -1,15 +1,15 @@
 """Main FastAPI application."""
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.core.startup import startup_checks
 from app.background_workers import lifespan
 
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app with lifespan manager for background workers
+# Create FastAPI app with lifespan manager for startup checks and background workers
 app = FastAPI(
     title=settings.APP_NAME,
     description="Document management system with OCR, RAG search, and LLM metadata extraction",
@@ -17,20 +17,12 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    # Serialize response bodies with orjson (Rust) instead of the stdlib json module
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Run startup checks and initialization."""
-    try:
-        startup_checks()
-    except Exception as e:
-        logger.error(f"Startup validation failed: {e}")
-        # Log the error but don't prevent startup (database might not be ready yet)
-        # The validation will run again on first use
-
 # Configure CORS
 cors_origins = settings.BACKEND_CORS_ORIGINS or ["http://localhost:8080"]
 app.add_middleware(
@@ -1,26 +1,70 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID, JSON
+import enum
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
 
 from app.database import Base
+from app.utils.ids import uuid7
+
+
+class ActivityAction(str, enum.Enum):
+    """Activity action enum."""
+    DOCUMENT_UPLOAD = "document.upload"
+    DOCUMENT_DELETE = "document.delete"
+    DOCUMENT_SHARE = "document.share"
+    USER_LOGIN = "user.login"
+
+
+class ActivityResourceType(str, enum.Enum):
+    """Activity resource type enum."""
+    DOCUMENT = "document"
+    USER = "user"
+    ROLE = "role"
 
 
 class ActivityLog(Base):
     """Activity/Audit log for tracking user actions."""
     __tablename__ = "activity_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    action = Column(String(100), nullable=False, index=True)  # e.g., "document.upload", "document.delete"
-    resource_type = Column(String(50), nullable=False, index=True)  # e.g., "document", "user", "role"
-    resource_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # ID of the affected resource
+    action = Column(
+        SQLEnum(ActivityAction, name="activityaction", values_callable=lambda x: [e.value for e in x]),
+        nullable=False
+    )  # e.g., "document.upload", "document.delete"
+    resource_type = Column(
+        SQLEnum(ActivityResourceType, name="activityresourcetype", values_callable=lambda x: [e.value for e in x]),
+        nullable=False
+    )  # e.g., "document", "user", "role"
+    resource_id = Column(UUID(as_uuid=True), nullable=True)  # ID of the affected resource
     description = Column(Text, nullable=False)  # Human-readable description
-    extra_data = Column(JSON, nullable=True)  # Additional context data
+    extra_data = Column(JSONB, nullable=True)  # Additional context data
     ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
     user_agent = Column(String(500), nullable=True)  # Browser/client info
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    # Partition key (monthly RANGE partitions), so it is part of the primary key
+    created_at = Column(DateTime, primary_key=True, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Composite indexes serve recency-ordered feeds without a separate sort
+        Index("ix_activity_logs_user_created", user_id, created_at.desc()),
+        Index(
+            "ix_activity_logs_resource",
+            resource_type,
+            resource_id,
+            created_at.desc(),
+            postgresql_where=resource_id.isnot(None),
+        ),
+        Index("ix_activity_logs_action_created", action, created_at.desc()),
+        # Append-only and time-ordered: BRIN prunes ranges with near-zero write cost
+        Index(
+            "ix_activity_logs_created_at",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
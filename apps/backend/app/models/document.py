@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -19,6 +20,7 @@ from sqlalchemy.orm import relationship
 from pgvector.sqlalchemy import Vector
 
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class Document(Base):
@@ -71,6 +73,11 @@ class Document(Base):
     # Full-text search vector (populated via trigger or application code)
     # search_vector = Column(TSVector)  # Will be added in migration
 
+    __table_args__ = (
+        # Deduplication target for create_document's INSERT ... ON CONFLICT
+        Index("ix_documents_owner_checksum", "owner_id", "checksum", unique=True),
+    )
+
     # Relationships
     owner = relationship("User", back_populates="owned_documents", foreign_keys=[owner_id])
     uploader = relationship("User", foreign_keys=[uploaded_by])
@@ -104,7 +111,7 @@ class DocumentEmbedding(Base):
 
     __tablename__ = "document_embeddings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
     chunk_index = Column(Integer)  # For chunked documents
     chunk_text = Column(Text)  # The text that was embedded
@@ -8,7 +8,9 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
+from app.core.encryption import EncryptedString
 from app.database import Base
+from app.utils.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -35,7 +37,7 @@ class ImportSource(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     source_type: Mapped[ImportSourceType] = mapped_column(
@@ -58,7 +60,8 @@ class ImportSource(Base):
     imap_server: Mapped[str | None] = mapped_column(String(255), nullable=True)
     imap_port: Mapped[int | None] = mapped_column(nullable=True)
     imap_username: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    imap_password: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Encrypted at rest; deferred so listing sources never loads or decrypts it
+    imap_password: Mapped[str | None] = mapped_column(EncryptedString(), nullable=True, deferred=True)
     imap_use_ssl: Mapped[bool] = mapped_column(Boolean, default=True)
     imap_mailbox: Mapped[str | None] = mapped_column(String(255), default="INBOX")
     imap_processed_folder: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -1,22 +1,34 @@
 """Document sharing models."""
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class DocumentShare(Base):
     """Document sharing model for granular permissions."""
 
     __tablename__ = "document_shares"
+    __table_args__ = (
+        # One share per document and user; covers access-check lookups index-only
+        Index(
+            "ix_document_shares_document_user",
+            "document_id",
+            "shared_with_user_id",
+            unique=True,
+            postgresql_include=["permission_level", "expires_at"],
+        ),
+        # Serves the shared-with-me listing (recipient + not expired)
+        Index("ix_document_shares_user_expires", "shared_with_user_id", "expires_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
-    shared_with_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    shared_with_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     shared_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     permission_level = Column(String(20), nullable=False)  # read, write, admin
     expires_at = Column(DateTime)
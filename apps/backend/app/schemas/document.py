@@ -1,13 +1,25 @@
 """Document schemas."""
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, computed_field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, field_serializer
 
 if TYPE_CHECKING:
     from app.schemas.tag import TagResponse
 
+# Common MIME types mapped to file extensions, built once rather than per serialization
+_MIME_TO_EXT = {
+    "application/pdf": "pdf",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/png": "png",
+    "image/tiff": "tiff",
+    "image/tif": "tif",
+    "image/bmp": "bmp",
+    "image/gif": "gif",
+}
+
 
 class DocumentBase(BaseModel):
     """Base document schema."""
@@ -32,12 +44,14 @@ class DocumentUpdate(BaseModel):
 class DocumentResponse(DocumentBase):
     """Schema for document response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     description: Optional[str] = None
     original_filename: str
     file_size: int
     mime_type: str
-    checksum: str
+    checksum: Optional[str] = None  # cleared on later duplicates by migration 016
     processing_status: str
     ocr_text: Optional[str] = None
     created_at: datetime
@@ -56,22 +70,12 @@ class DocumentResponse(DocumentBase):
     @property
     def file_extension(self) -> str:
         """Extract file extension from mime type (actual stored file type)."""
-        # Map common MIME types to extensions
-        mime_to_ext = {
-            "application/pdf": "pdf",
-            "image/jpeg": "jpg",
-            "image/jpg": "jpg",
-            "image/png": "png",
-            "image/tiff": "tiff",
-            "image/tif": "tif",
-            "image/bmp": "bmp",
-            "image/gif": "gif",
-        }
-        
         # Try to get from mime_type first (reflects actual stored file)
-        if self.mime_type and self.mime_type.lower() in mime_to_ext:
-            return mime_to_ext[self.mime_type.lower()]
-        
+        if self.mime_type:
+            ext = _MIME_TO_EXT.get(self.mime_type.lower())
+            if ext:
+                return ext
+
         # Fallback to original filename extension
         if "." in self.original_filename:
             return self.original_filename.rsplit(".", 1)[-1].lower()
@@ -85,7 +89,6 @@ class DocumentResponse(DocumentBase):
             return None
         # If naive datetime, assume it's UTC and make it timezone-aware
         if value.tzinfo is None:
-            from datetime import timezone
             value = value.replace(tzinfo=timezone.utc)
         return value.isoformat()
     
@@ -96,9 +99,6 @@ class DocumentResponse(DocumentBase):
             return None
         return value.isoformat()  # Returns YYYY-MM-DD format
 
-    class Config:
-        from_attributes = True
-
 
 class DocumentListResponse(BaseModel):
     """Schema for paginated document list."""
@@ -113,3 +113,7 @@ class DocumentListResponse(BaseModel):
 from app.schemas.tag import TagResponse
 
 DocumentResponse.model_rebuild()
+
+# Validates a whole list of ORM documents in one call into pydantic-core,
+# instead of one model_validate() round-trip per row
+document_list_adapter = TypeAdapter(List[DocumentResponse])
@@ -1,11 +1,91 @@
-from typing import Optional, Dict, Any
+import atexit
+import logging
+import queue
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, List
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from fastapi import Request
 
 from app.models.activity_log import ActivityLog
 from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
+# Background write queue for the log_* helpers: entries are flushed by a daemon
+# thread in one multi-row INSERT per batch (up to _FLUSH_BATCH_SIZE rows, or
+# whatever arrived within _FLUSH_INTERVAL_SECONDS), keeping the commit out of the
+# request path. When the queue is full, entries are written synchronously.
+_FLUSH_BATCH_SIZE = 500
+_FLUSH_INTERVAL_SECONDS = 0.5
+_LOG_QUEUE: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10000)
+_flusher: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+
+
+def _drain(first: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect a batch starting with first, waiting briefly for more entries."""
+    batch = [first]
+    timeout = _FLUSH_INTERVAL_SECONDS
+    while len(batch) < _FLUSH_BATCH_SIZE:
+        try:
+            batch.append(_LOG_QUEUE.get(timeout=timeout))
+        except queue.Empty:
+            break
+        timeout = 0.01
+    return batch
+
+
+def _write_batch(batch: List[Dict[str, Any]]) -> None:
+    """Insert a batch of queued entries in its own session and transaction."""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        ActivityLogger.log_many(db, batch)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to write {len(batch)} activity log entries: {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+def _flush_forever() -> None:
+    """Daemon loop: block for the next entry, then write it with whatever follows."""
+    while True:
+        batch = _drain(_LOG_QUEUE.get())
+        _write_batch(batch)
+        for _ in batch:
+            _LOG_QUEUE.task_done()
+
+
+def flush_pending() -> None:
+    """Write any queued entries now (used at interpreter exit)."""
+    batch = []
+    while True:
+        try:
+            batch.append(_LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write_batch(batch)
+        for _ in batch:
+            _LOG_QUEUE.task_done()
+
+
+def _ensure_flusher() -> None:
+    """Start the background flusher thread on first use."""
+    global _flusher
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_forever, name="activity-log-flusher", daemon=True)
+            _flusher.start()
+            atexit.register(flush_pending)
+
 
 class ActivityLogger:
     """Service for logging user activities."""
@@ -34,6 +114,60 @@ class ActivityLogger:
             extra_data: Additional context data (optional)
             request: FastAPI request object for IP/user agent (optional)
         """
+        log_entry = ActivityLog(
+            **ActivityLogger._build_row(
+                action, resource_type, description, user, resource_id, extra_data, request
+            )
+        )
+
+        # id and created_at are client-side defaults, so no refresh is needed
+        db.add(log_entry)
+        db.commit()
+
+        return log_entry
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        action: str,
+        resource_type: str,
+        description: str,
+        user: Optional[User] = None,
+        resource_id: Optional[UUID] = None,
+        extra_data: Optional[Dict[str, Any]] = None,
+        request: Optional[Request] = None,
+    ) -> None:
+        """
+        Queue an activity to be written by the background flusher.
+
+        Takes the same arguments as log() but returns immediately; use log() when the
+        caller needs the stored row. The session is only used to write synchronously
+        if the queue is full.
+        """
+        row = ActivityLogger._build_row(
+            action, resource_type, description, user, resource_id, extra_data, request
+        )
+        # Stamp the event time now rather than when the batch is flushed
+        row["created_at"] = datetime.utcnow()
+
+        _ensure_flusher()
+        try:
+            _LOG_QUEUE.put_nowait(row)
+        except queue.Full:
+            logger.warning("Activity log queue full, writing entry synchronously")
+            ActivityLogger.log_many(db, [row])
+
+    @staticmethod
+    def _build_row(
+        action: str,
+        resource_type: str,
+        description: str,
+        user: Optional[User],
+        resource_id: Optional[UUID],
+        extra_data: Optional[Dict[str, Any]],
+        request: Optional[Request],
+    ) -> Dict[str, Any]:
+        """Build the ActivityLog column values for an activity."""
         ip_address = None
         user_agent = None
 
@@ -44,22 +178,45 @@ class ActivityLogger:
             # Get user agent
             user_agent = request.headers.get("user-agent")
 
-        log_entry = ActivityLog(
-            user_id=user.id if user else None,
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            description=description,
-            extra_data=extra_data,
-            ip_address=ip_address,
-            user_agent=user_agent,
-        )
+        return {
+            "user_id": user.id if user else None,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "description": description,
+            "extra_data": extra_data,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
 
-        db.add(log_entry)
+    @staticmethod
+    def log_many(db: Session, entries: List[Dict[str, Any]]) -> int:
+        """
+        Log several activities with a single multi-row INSERT.
+
+        Use this instead of calling log() in a loop for bulk operations; rows are
+        sent as one statement and committed once.
+
+        Args:
+            db: Database session
+            entries: Row dicts with ActivityLog column names (action, resource_type,
+                description, and optionally user_id, resource_id, extra_data,
+                ip_address, user_agent)
+
+        Returns:
+            Number of rows logged
+        """
+        if not entries:
+            return 0
+
+        # executemany needs every row to carry the same keys
+        optional_columns = ("user_id", "resource_id", "extra_data", "ip_address", "user_agent")
+        rows = [{**dict.fromkeys(optional_columns), **entry} for entry in entries]
+
+        db.execute(insert(ActivityLog), rows)
         db.commit()
-        db.refresh(log_entry)
 
-        return log_entry
+        return len(entries)
 
     @staticmethod
     def log_document_upload(
@@ -70,7 +227,7 @@ class ActivityLogger:
         request: Optional[Request] = None,
     ):
         """Log document upload activity."""
-        return ActivityLogger.log(
+        ActivityLogger.enqueue(
             db=db,
             action="document.upload",
             resource_type="document",
@@ -90,7 +247,7 @@ class ActivityLogger:
         request: Optional[Request] = None,
     ):
         """Log document deletion activity."""
-        return ActivityLogger.log(
+        ActivityLogger.enqueue(
             db=db,
             action="document.delete",
             resource_type="document",
@@ -109,7 +266,7 @@ class ActivityLogger:
         request: Optional[Request] = None,
     ):
         """Log user login activity."""
-        return ActivityLogger.log(
+        ActivityLogger.enqueue(
             db=db,
             action="user.login",
             resource_type="user",
@@ -129,7 +286,7 @@ class ActivityLogger:
         request: Optional[Request] = None,
     ):
         """Log document sharing activity."""
-        return ActivityLogger.log(
+        ActivityLogger.enqueue(
             db=db,
             action="document.share",
             resource_type="document",
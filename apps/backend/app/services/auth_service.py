@@ -9,7 +9,7 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
 )
 from app.models.user import User
 from app.schemas.auth import Token, UserLogin, UserRegister
@@ -78,13 +78,22 @@ class AuthService:
             raise AuthenticationError("Incorrect email or password")
 
         # Verify password
-        if not user.hashed_password or not verify_password(login_data.password, user.hashed_password):
+        if not user.hashed_password:
+            raise AuthenticationError("Incorrect email or password")
+
+        is_valid, new_hash = verify_and_update_password(login_data.password, user.hashed_password)
+        if not is_valid:
             raise AuthenticationError("Incorrect email or password")
 
         # Check if user is active
         if not user.is_active:
             raise AuthenticationError("User account is disabled")
 
+        # Transparently upgrade hashes created with an older, lower bcrypt cost
+        if new_hash:
+            user.hashed_password = new_hash
+            self.db.commit()
+
         # Generate tokens
         access_token = create_access_token(subject=str(user.id))
         refresh_token = create_refresh_token(subject=str(user.id))
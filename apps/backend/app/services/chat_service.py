@@ -1,8 +1,12 @@
 """Chat service for RAG-based document Q&A."""
 import logging
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.schemas.chat import ChatMessage, ChatResponse, DocumentSource
@@ -11,6 +15,112 @@ from app.services.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
 
+# Process-wide semantic cache of answered questions. Entries are scoped by user and
+# retrieval settings; a new question whose embedding has cosine similarity of at
+# least SEMANTIC_CACHE_THRESHOLD with a cached one reuses that answer and skips both
+# vector search and the LLM. Only questions without conversation history are cached,
+# and entries expire so newly uploaded documents are picked up. Question vectors are
+# stored as int8 codes with a per-vector scale (SQ8), a quarter of the FP32 size;
+# with the per-scope stacks below, the cache holds half what FP32 vectors would.
+SEMANTIC_CACHE_SIZE = 512
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL_SECONDS = 600
+_semantic_cache: "OrderedDict[Tuple[tuple, str], Tuple[np.ndarray, float, ChatResponse, float]]" = OrderedDict()
+_semantic_cache_lock = threading.Lock()
+# Per-scope (keys, stacked int8 codes, scales) built on the first lookup and reused
+# until an entry in that scope is added, evicted or expires. The stack stays int8,
+# so it costs another quarter of the FP32 size rather than a full FP32 copy.
+_semantic_matrices: Dict[tuple, Tuple[List[Tuple[tuple, str]], np.ndarray, np.ndarray]] = {}
+
+# Retrieved chunks more similar than this to a higher-scoring chunk (e.g. the same
+# passage in two versions of a document) are dropped before prompting the LLM
+CHUNK_DEDUP_THRESHOLD = 0.92
+
+
+def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+    """Return the unit-length vector for an embedding, or None for a zero vector."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return None
+    return vector / norm
+
+
+def _pack_int8(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Quantize a vector to int8 codes and the scale that maps them back (code * scale)."""
+    scale = float(np.abs(vector).max()) / 127
+    if scale == 0:
+        return np.zeros(vector.shape, dtype=np.int8), 0.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+def _dedup_chunks(chunk_texts: List[str], embeddings: List[Optional[List[float]]]) -> List[str]:
+    """Drop near-duplicate chunks, keeping the first (highest-scoring) of each group."""
+    if len(chunk_texts) < 2 or any(embedding is None for embedding in embeddings):
+        return chunk_texts
+
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1, norms)
+    similarities = vectors @ vectors.T
+
+    kept: List[int] = []
+    for i in range(len(chunk_texts)):
+        if not kept or similarities[i, kept].max() <= CHUNK_DEDUP_THRESHOLD:
+            kept.append(i)
+    return [chunk_texts[i] for i in kept]
+
+
+def _semantic_cache_get(scope: tuple, question: str, vector: np.ndarray) -> Optional[ChatResponse]:
+    """Return the cached response for the most similar question in scope, if close enough."""
+    now = time.monotonic()
+    with _semantic_cache_lock:
+        expired = [
+            key for key, (_, _, _, stored_at) in _semantic_cache.items()
+            if now - stored_at > SEMANTIC_CACHE_TTL_SECONDS
+        ]
+        for key in expired:
+            del _semantic_cache[key]
+            _semantic_matrices.pop(key[0], None)
+
+        exact = _semantic_cache.get((scope, question))
+        if exact is not None:
+            _semantic_cache.move_to_end((scope, question))
+            return exact[2]
+
+        if scope in _semantic_matrices:
+            keys, codes, scales = _semantic_matrices[scope]
+        else:
+            keys = [key for key in _semantic_cache if key[0] == scope]
+            if not keys:
+                return None
+            codes = np.stack([_semantic_cache[key][0] for key in keys])
+            scales = np.array([_semantic_cache[key][1] for key in keys], dtype=np.float32)
+            _semantic_matrices[scope] = (keys, codes, scales)
+
+        # Cached vectors are unit length, so one matrix-vector product gives every
+        # cosine. The codes are widened to FP32 only for the product (numpy's integer
+        # matmul is not BLAS-backed), then each row's scale is applied.
+        similarities = (codes.astype(np.float32) @ vector) * scales
+        best = int(np.argmax(similarities))
+        if similarities[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        _semantic_cache.move_to_end(keys[best])
+        return _semantic_cache[keys[best]][2]
+
+
+def _semantic_cache_put(scope: tuple, question: str, vector: np.ndarray, response: ChatResponse) -> None:
+    """Store an answered question, evicting least recently used entries."""
+    codes, scale = _pack_int8(vector)
+    with _semantic_cache_lock:
+        _semantic_cache[(scope, question)] = (codes, scale, response, time.monotonic())
+        _semantic_cache.move_to_end((scope, question))
+        _semantic_matrices.pop(scope, None)
+        while len(_semantic_cache) > SEMANTIC_CACHE_SIZE:
+            evicted, _ = _semantic_cache.popitem(last=False)
+            _semantic_matrices.pop(evicted[0], None)
+
 
 class ChatService:
     """Service for RAG-based chat with documents."""
@@ -58,11 +168,25 @@ class ChatService:
 
         # Step 1: Retrieve relevant document chunks using vector search
         try:
+            # Embed once: the vector drives both the semantic cache and the search
+            query_embedding = self.vector_search_service.embedding_service.generate_embedding(question)
+
+            # Answers depend on prior turns, so only stand-alone questions are cached
+            cache_scope = (str(user_id), num_chunks, similarity_threshold)
+            cache_vector = None if conversation_history else _normalize(query_embedding)
+            if cache_vector is not None:
+                cached = _semantic_cache_get(cache_scope, question, cache_vector)
+                if cached is not None:
+                    logger.info("Answered from semantic cache")
+                    return cached
+
             search_results = self.vector_search_service.vector_search(
                 query=question,
                 user_id=user_id,
                 limit=num_chunks,
                 similarity_threshold=similarity_threshold,
+                query_embedding=query_embedding,
+                include_embeddings=True,
             )
             logger.info(f"Retrieved {len(search_results)} relevant chunks")
         except Exception as e:
@@ -85,13 +209,18 @@ class ChatService:
 
         # Step 2: Extract chunks and build sources list
         chunks = []
+        chunk_embeddings = []
         sources = []
         seen_doc_ids = set()
 
-        for doc, score, chunk_text in search_results:
+        # Best matches first, so deduplication keeps the highest-scoring copy
+        search_results = sorted(search_results, key=lambda result: result[1], reverse=True)
+
+        for doc, score, chunk_text, chunk_embedding in search_results:
             # Add chunk text
             if chunk_text:
                 chunks.append(chunk_text)
+                chunk_embeddings.append(chunk_embedding)
 
             # Add document to sources (avoid duplicates)
             if doc.id not in seen_doc_ids:
@@ -104,6 +233,9 @@ class ChatService:
                 )
                 seen_doc_ids.add(doc.id)
 
+        # Drop near-duplicate chunks to save prompt tokens
+        chunks = _dedup_chunks(chunks, chunk_embeddings)
+
         logger.info(f"Using {len(chunks)} chunks from {len(sources)} documents")
 
         # Step 3: Convert conversation history to dict format for LLM
@@ -130,9 +262,12 @@ class ChatService:
                 chunks_used=chunks,
             )
 
-        # Step 5: Return response
-        return ChatResponse(
+        # Step 5: Cache and return response
+        response = ChatResponse(
             answer=answer,
             sources=sources,
             chunks_used=chunks,
         )
+        if cache_vector is not None:
+            _semantic_cache_put(cache_scope, question, cache_vector, response)
+        return response
@@ -1,15 +1,44 @@
 """Document service for handling document operations."""
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import UploadFile
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.exceptions import DuplicateError, NotFoundError
 from app.models.document import Document
 from app.schemas.document import DocumentCreate, DocumentResponse
+from app.schemas.tag import TagResponse
 from app.services.storage_service import StorageService
 
+# DocumentResponse fields read straight off the ORM row (tags are converted separately)
+_RESPONSE_FIELDS = tuple(name for name in DocumentResponse.model_fields if name != "tags")
+
+# Loader options for serializing documents as DocumentResponse: load only the
+# columns the schema reads (skipping file_path, processing_error, ...) and fetch
+# every row's tags in one extra IN query instead of one lazy load per document
+DOCUMENT_RESPONSE_LOAD_OPTIONS = (
+    load_only(*(getattr(Document, name) for name in _RESPONSE_FIELDS)),
+    selectinload(Document.tags),
+)
+
+
+def _to_response(document: Document) -> DocumentResponse:
+    """
+    Build a DocumentResponse from an ORM document without re-validating it.
+
+    Column values come straight from the database, so only the nested tags are
+    validated (model_construct would leave them as ORM objects).
+    """
+    return DocumentResponse.model_construct(
+        **{name: getattr(document, name) for name in _RESPONSE_FIELDS},
+        tags=[TagResponse.model_validate(tag) for tag in document.tags],
+    )
+
 
 class DocumentService:
     """Service for handling document operations."""
@@ -45,21 +74,6 @@ class DocumentService:
         Raises:
             DuplicateError: If document with same checksum already exists
         """
-        # Calculate checksum for deduplication
-        checksum = await self.storage.calculate_checksum(file)
-
-        # Check for duplicates
-        existing = self.db.query(Document).filter(
-            Document.checksum == checksum,
-            Document.owner_id == user_id
-        ).first()
-
-        if existing:
-            raise DuplicateError(
-                f"Document already exists",
-                detail={"document_id": str(existing.id)}
-            )
-
         # Create document record
         import uuid
         document_id = uuid.uuid4()
@@ -70,36 +84,73 @@ class DocumentService:
         # Get filename
         filename = file.filename or "document"
 
-        # Save file to storage (images are automatically converted to PDF)
-        file_path, final_filename, mime_type = await self.storage.save_file(file, document_id, filename)
+        # Save file to storage, hashing it for deduplication in the same pass. Image to
+        # PDF conversion waits until the upload is known not to be a duplicate
+        file_path, final_filename, mime_type, checksum = await self.storage.save_file_with_checksum(
+            file, document_id, filename, convert_images_to_pdf=False
+        )
 
         # Get file size
         file_size = self.storage.get_file_size(file_path)
 
-        # Create database record
-        db_document = Document(
-            id=document_id,
-            title=doc_title,
-            original_filename=filename,  # Keep original filename for user reference
-            file_path=file_path,
-            file_size=file_size,
-            mime_type=mime_type,  # Use the actual MIME type (will be application/pdf for converted images)
-            checksum=checksum,
-            owner_id=user_id,
-            uploaded_by=user_id,  # Track who uploaded the file
-            processing_status="pending"  # Will be processed by background task
+        # Insert unless this owner already has the checksum: one round-trip, and
+        # ix_documents_owner_checksum makes concurrent duplicate uploads safe
+        now = datetime.utcnow()
+        stmt = (
+            pg_insert(Document)
+            .values(
+                id=document_id,
+                title=doc_title,
+                original_filename=filename,  # Keep original filename for user reference
+                file_path=file_path,
+                file_size=file_size,
+                mime_type=mime_type,  # Use the actual MIME type (will be application/pdf for converted images)
+                checksum=checksum,
+                owner_id=user_id,
+                uploaded_by=user_id,  # Track who uploaded the file
+                processing_status="pending",  # Will be processed by background task
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=["owner_id", "checksum"])
+            .returning(Document)
         )
+        db_document = self.db.scalars(stmt).first()
+
+        if db_document is None:
+            self.db.rollback()
+            self.storage.delete_file(file_path)
+            existing_id = self.db.query(Document.id).filter(
+                Document.checksum == checksum,
+                Document.owner_id == user_id
+            ).scalar()
+            raise DuplicateError(
+                f"Document already exists",
+                detail={"document_id": str(existing_id)}
+            )
 
-        self.db.add(db_document)
+        # Images are stored as PDF
+        converted_path, final_filename, converted_mime_type = self.storage.convert_saved_file(
+            file_path, mime_type
+        )
+        if converted_path != file_path:
+            db_document.file_path = converted_path
+            db_document.mime_type = converted_mime_type
+            db_document.file_size = self.storage.get_file_size(converted_path)
+            self.db.flush()
+
+        # A new document has no tags; mark the collection loaded so serializing it doesn't SELECT
+        set_committed_value(db_document, "tags", [])
+        # Serialize before commit: commit expires the instance and reading it back would SELECT
+        response = _to_response(db_document)
         self.db.commit()
-        self.db.refresh(db_document)
 
         # Trigger background processing
         from app.tasks.document_tasks import process_document
 
-        process_document.delay(str(db_document.id))
+        process_document.delay(str(document_id))
 
-        return DocumentResponse.model_validate(db_document)
+        return response
 
     def get_document(self, document_id: UUID, user_id: UUID) -> DocumentResponse:
         """
@@ -123,7 +174,7 @@ class DocumentService:
         if not document:
             raise NotFoundError("Document not found")
 
-        return DocumentResponse.model_validate(document)
+        return _to_response(document)
 
     def list_documents(
         self,
@@ -142,13 +193,17 @@ class DocumentService:
         Returns:
             List of documents
         """
-        documents = self.db.query(Document).filter(
-            Document.owner_id == user_id
-        ).order_by(
-            Document.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        stmt = (
+            select(Document)
+            .options(*DOCUMENT_RESPONSE_LOAD_OPTIONS)
+            .where(Document.owner_id == user_id)
+            .order_by(Document.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        documents = self.db.scalars(stmt).all()
 
-        return [DocumentResponse.model_validate(doc) for doc in documents]
+        return [_to_response(document) for document in documents]
 
     def update_document(
         self,
@@ -186,11 +241,15 @@ class DocumentService:
             document.title = document_update.title
         if document_update.description is not None:
             document.description = document_update.description
+        if self.db.is_modified(document):
+            document.updated_at = datetime.utcnow()
 
+        self.db.flush()
+        # Serialize before commit: commit expires the instance and reading it back would SELECT
+        response = _to_response(document)
         self.db.commit()
-        self.db.refresh(document)
 
-        return DocumentResponse.model_validate(document)
+        return response
 
     def delete_document(self, document_id: UUID, user_id: UUID) -> bool:
         """
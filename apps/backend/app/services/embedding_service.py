@@ -1,9 +1,117 @@
 """Embedding service for generating vector embeddings."""
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Process-wide LRU of embeddings keyed by "provider:model:sha256(text)", shared by
+# every EmbeddingService instance so repeated chunks and queries skip the model or
+# API call. Vectors are stored as read-only float32 arrays (6 KB at 1536 dimensions,
+# versus ~50 KB as a Python float list).
+EMBEDDING_CACHE_SIZE = 4096  # ~25 MB at 1536 dimensions
+_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+_embedding_cache_stats = {"hits": 0, "misses": 0}
+
+# OpenAI accepts up to 2048 inputs per embeddings request; batches are sent
+# concurrently, capped so large documents don't trip the rate limiter.
+OPENAI_MAX_INPUTS_PER_REQUEST = 2048
+OPENAI_EMBEDDING_CONCURRENCY = 8
+OPENAI_RATE_LIMIT_RETRIES = 3
+
+# Ollama's client is synchronous; a few requests in flight overlap HTTP and
+# tokenization with the server's own queueing
+OLLAMA_EMBEDDING_CONCURRENCY = 4
+
+# Chunk boundaries: end of a sentence (". ", "! ", "? ") or paragraph, else a space
+_SENTENCE_BOUNDARY_RE = re.compile(r"[.!?] |\n\n")
+_WORD_BOUNDARY_RE = re.compile(" ")
+
+# Known embedding dimensions per provider, matched by substring of the model name
+# (so tags like "nomic-embed-text:latest" resolve), with a per-provider fallback.
+# Any provider other than openai/ollama uses local sentence-transformers models.
+_MODEL_DIMENSIONS: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    "openai": (
+        ("text-embedding-3-small", 1536),
+        ("text-embedding-3-large", 3072),
+        ("text-embedding-ada-002", 1536),
+    ),
+    "ollama": (
+        ("nomic-embed-text", 768),
+        ("mxbai-embed-large", 1024),
+        ("all-minilm", 384),
+    ),
+    "local": (
+        ("mpnet", 768),
+        ("MiniLM", 384),
+    ),
+}
+_DEFAULT_DIMENSIONS = {"openai": 1536, "ollama": 768, "local": 384}
+
+
+@lru_cache(maxsize=32)
+def _detect_dimension(provider: str, model_name: str) -> int:
+    """Return the embedding dimension for a provider/model pair."""
+    if provider not in _DEFAULT_DIMENSIONS:
+        provider = "local"
+    for fragment, dimension in _MODEL_DIMENSIONS[provider]:
+        if fragment in model_name:
+            return dimension
+    return _DEFAULT_DIMENSIONS[provider]
+
+
+@lru_cache(maxsize=8)
+def _get_sentence_transformer(model_name: str):
+    """
+    Load a sentence-transformers model once per process.
+
+    Weights are shared by every EmbeddingService using the model. On CUDA the
+    model is converted to FP16; on CPU it stays FP32, where half precision is slower.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.error(
+            "sentence-transformers not installed. Install with: pip install sentence-transformers"
+        )
+        raise
+
+    try:
+        logger.info(f"Loading local embedding model: {model_name}")
+        model = SentenceTransformer(model_name)
+        model.eval()
+        if str(model.device).startswith("cuda"):
+            model = model.half()
+        logger.info(f"Embedding model loaded successfully")
+        return model
+    except Exception as e:
+        logger.error(f"Failed to load embedding model: {e}")
+        raise
+
+
+def embedding_cache_stats() -> Dict[str, int]:
+    """Return embedding cache hit/miss counters and current size."""
+    with _embedding_cache_lock:
+        return {**_embedding_cache_stats, "size": len(_embedding_cache)}
+
+
+def _is_missing_endpoint_error(error: Exception) -> bool:
+    """Whether an Ollama error means the server has no /api/embed endpoint (an older Ollama)."""
+    if getattr(error, "status_code", None) != 404:
+        return False
+    # An unknown model is also a 404, but per-text requests would fail the same way
+    return "model" not in str(getattr(error, "error", error)).lower()
+
 
 class EmbeddingService:
     """Service for generating text embeddings using local models, OpenAI API, or Ollama."""
@@ -32,37 +140,13 @@ class EmbeddingService:
         self.base_url = base_url or "http://localhost:11434"
         self.model = None
         self._ollama_client = None
+        # Whether the Ollama server has the batch /api/embed endpoint (None until probed)
+        self._ollama_batch_supported: Optional[bool] = None
+        # Instances may be shared across threads; load the model only once
+        self._model_lock = threading.Lock()
 
         # Set dimension (use provided or auto-detect)
-        if dimension:
-            self.dimension = dimension
-        elif provider == "openai":
-            if "text-embedding-3-small" in model_name:
-                self.dimension = 1536
-            elif "text-embedding-3-large" in model_name:
-                self.dimension = 3072
-            elif "text-embedding-ada-002" in model_name:
-                self.dimension = 1536
-            else:
-                self.dimension = 1536  # Default for OpenAI
-        elif provider == "ollama":
-            # Common Ollama embedding models
-            if "nomic-embed-text" in model_name:
-                self.dimension = 768
-            elif "mxbai-embed-large" in model_name:
-                self.dimension = 1024
-            elif "all-minilm" in model_name:
-                self.dimension = 384
-            else:
-                self.dimension = 768  # Default for Ollama
-        else:
-            # Local sentence-transformers models
-            if "mpnet" in model_name:
-                self.dimension = 768
-            elif "MiniLM" in model_name:
-                self.dimension = 384
-            else:
-                self.dimension = 384  # Default
+        self.dimension = dimension or _detect_dimension(provider, model_name)
 
     def _load_model(self):
         """Lazy load the embedding model (local models only)."""
@@ -70,21 +154,12 @@ class EmbeddingService:
             # OpenAI and Ollama don't need a loaded model
             return
 
-        if self.model is None:
-            try:
-                from sentence_transformers import SentenceTransformer
+        if self.model is not None:
+            return
 
-                logger.info(f"Loading local embedding model: {self.model_name}")
-                self.model = SentenceTransformer(self.model_name)
-                logger.info(f"Embedding model loaded successfully")
-            except ImportError:
-                logger.error(
-                    "sentence-transformers not installed. Install with: pip install sentence-transformers"
-                )
-                raise
-            except Exception as e:
-                logger.error(f"Failed to load embedding model: {e}")
-                raise
+        with self._model_lock:
+            if self.model is None:
+                self.model = _get_sentence_transformer(self.model_name)
 
     def _initialize_ollama_client(self):
         """Lazy initialize Ollama client."""
@@ -114,19 +189,56 @@ class EmbeddingService:
             # Return zero vector for empty text
             return [0.0] * self.dimension
 
+        key = self._cache_key(text)
+        cached = self._cache_get([key])
+        if cached[0] is not None:
+            return cached[0].tolist()
+
         if self.provider == "openai":
-            return self._generate_openai_embedding(text)
+            embedding = self._generate_openai_embedding(text)
         elif self.provider == "ollama":
-            return self._generate_ollama_embedding(text)
+            embedding = self._generate_ollama_embedding(text)
         else:
-            return self._generate_local_embedding(text)
+            embedding = self._generate_local_embedding(text)
+
+        self._cache_put([(key, np.asarray(embedding, dtype=np.float32))])
+        return embedding
+
+    def _cache_key(self, text: str) -> str:
+        """Build the embedding cache key for a text."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.provider}:{self.model_name}:{digest}"
+
+    def _cache_get(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        """Look up cached embeddings, returning None for each miss."""
+        results = []
+        with _embedding_cache_lock:
+            for key in keys:
+                embedding = _embedding_cache.get(key)
+                if embedding is not None:
+                    _embedding_cache.move_to_end(key)
+                    _embedding_cache_stats["hits"] += 1
+                else:
+                    _embedding_cache_stats["misses"] += 1
+                results.append(embedding)
+        return results
+
+    def _cache_put(self, items: List[Tuple[str, np.ndarray]]) -> None:
+        """Store (key, float32 embedding) pairs, evicting least recently used entries."""
+        with _embedding_cache_lock:
+            for key, embedding in items:
+                embedding.flags.writeable = False
+                _embedding_cache[key] = embedding
+                _embedding_cache.move_to_end(key)
+            while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
 
     def _generate_local_embedding(self, text: str) -> List[float]:
         """Generate embedding using local sentence-transformers model."""
         self._load_model()
 
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
+            embedding = self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
             return embedding.tolist()
         except Exception as e:
             logger.error(f"Failed to generate local embedding: {e}")
@@ -164,7 +276,7 @@ class EmbeddingService:
             logger.error(f"Failed to generate Ollama embedding: {e}")
             raise
 
-    def generate_embeddings(self, texts: List[str], batch_size: int = 8) -> List[List[float]]:
+    def generate_embeddings(self, texts: List[str], batch_size: int = 8) -> np.ndarray:
         """
         Generate embeddings for multiple texts (batch processing).
 
@@ -173,122 +285,188 @@ class EmbeddingService:
             batch_size: Number of texts to process at once (smaller = less memory for local)
 
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimension), one row per text
         """
         if not texts:
-            return []
+            return np.empty((0, self.dimension), dtype=np.float32)
+        if len(texts) == 1:
+            # Single text: skip the hit/miss bookkeeping (blank text gets a zero vector)
+            return np.asarray([self.generate_embedding(texts[0])], dtype=np.float32)
+
+        # Serve repeated texts from the cache and only send the misses to the provider
+        keys = [self._cache_key(text) for text in texts]
+        cached = self._cache_get(keys)
+        miss_indexes = [i for i, embedding in enumerate(cached) if embedding is None]
+
+        embeddings = None
+        if miss_indexes:
+            misses = [texts[i] for i in miss_indexes]
+            if self.provider == "openai":
+                embeddings = self._generate_openai_embeddings(misses, batch_size)
+            elif self.provider == "ollama":
+                embeddings = self._generate_ollama_embeddings(misses, batch_size)
+            else:
+                embeddings = self._generate_local_embeddings(misses, batch_size)
 
-        if self.provider == "openai":
-            return self._generate_openai_embeddings(texts, batch_size)
-        elif self.provider == "ollama":
-            return self._generate_ollama_embeddings(texts, batch_size)
+            if len(miss_indexes) == len(texts):
+                results = embeddings
+            else:
+                results = np.empty((len(texts), embeddings.shape[1]), dtype=np.float32)
+                results[miss_indexes] = embeddings
         else:
-            return self._generate_local_embeddings(texts, batch_size)
+            results = np.empty((len(texts), cached[0].shape[0]), dtype=np.float32)
 
-    def _generate_local_embeddings(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        # Fill the hits into the one output buffer
+        for i, embedding in enumerate(cached):
+            if embedding is not None:
+                results[i] = embedding
+
+        if miss_indexes:
+            # Cache copies so later writes to the returned array can't alter cached rows
+            self._cache_put([(keys[i], results[i].copy()) for i in miss_indexes])
+        return results
+
+    def _generate_local_embeddings(self, texts: List[str], batch_size: int) -> np.ndarray:
         """Generate embeddings using local sentence-transformers model."""
         self._load_model()
 
         try:
-            all_embeddings = []
-
-            # Process in smaller batches to avoid memory issues
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                logger.info(f"Processing local embedding batch {i//batch_size + 1}/{(len(texts)-1)//batch_size + 1} ({len(batch)} chunks)")
-
-                batch_embeddings = self.model.encode(
-                    batch,
-                    convert_to_numpy=True,
-                    show_progress_bar=False,
-                    batch_size=batch_size
-                )
-                all_embeddings.extend(batch_embeddings.tolist())
-
-            return all_embeddings
+            logger.info(f"Processing {len(texts)} local embeddings (batch_size={batch_size})")
+
+            # One encode call: sentence-transformers batches internally (sorted by
+            # length to minimise padding) and returns a single contiguous array, so
+            # Python lists are only built once at the end
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            return embeddings.astype(np.float32, copy=False)
         except Exception as e:
             logger.error(f"Failed to generate local batch embeddings: {e}")
             raise
 
-    def _generate_openai_embeddings(self, texts: List[str], batch_size: int) -> List[List[float]]:
+    def _generate_openai_embeddings(self, texts: List[str], batch_size: int) -> np.ndarray:
         """Generate embeddings using OpenAI API (supports up to 2048 texts per request)."""
-        logger.info(f"_generate_openai_embeddings called with {len(texts)} texts, batch_size={batch_size}")
+        if not self.api_key:
+            raise ValueError("OpenAI API key is required for OpenAI embeddings")
 
-        try:
-            logger.info("Importing OpenAI package...")
-            from openai import OpenAI
-            logger.info("OpenAI package imported successfully")
+        if len(texts) <= min(batch_size * 10, OPENAI_MAX_INPUTS_PER_REQUEST):
+            # Fits in one request: skip the event loop and batch bookkeeping
+            try:
+                from openai import OpenAI
 
-            if not self.api_key:
-                raise ValueError("OpenAI API key is required for OpenAI embeddings")
+                client = OpenAI(api_key=self.api_key)
+                response = client.embeddings.create(input=texts, model=self.model_name)
+                return np.asarray([item.embedding for item in response.data], dtype=np.float32)
+            except ImportError:
+                logger.error("openai package not installed. Install with: pip install openai")
+                raise
+            except Exception as e:
+                logger.error(f"Failed to generate OpenAI batch embeddings: {e}", exc_info=True)
+                raise
 
-            logger.info(f"Creating OpenAI client (API key length: {len(self.api_key) if self.api_key else 0})")
-            client = OpenAI(api_key=self.api_key)
-            logger.info("OpenAI client created successfully")
-
-            all_embeddings = []
-
-            # OpenAI supports large batches (up to 2048), but we'll use smaller batches
-            # to avoid rate limits and allow for retries
-            openai_batch_size = min(batch_size * 10, 100)  # Process up to 100 at a time
-            logger.info(f"Using OpenAI batch size: {openai_batch_size}")
-
-            for i in range(0, len(texts), openai_batch_size):
-                batch = texts[i:i + openai_batch_size]
-                batch_num = i//openai_batch_size + 1
-                total_batches = (len(texts)-1)//openai_batch_size + 1
-
-                logger.info(f"Processing OpenAI embedding batch {batch_num}/{total_batches} ({len(batch)} chunks)")
-                logger.info(f"First text in batch preview: {batch[0][:50]}...")
-
-                try:
-                    logger.info(f"Making OpenAI API call for batch {batch_num}...")
-                    response = client.embeddings.create(input=batch, model=self.model_name)
-                    logger.info(f"OpenAI API call successful for batch {batch_num}")
-
-                    batch_embeddings = [item.embedding for item in response.data]
-                    logger.info(f"Extracted {len(batch_embeddings)} embeddings from response")
-                    all_embeddings.extend(batch_embeddings)
-                    logger.info(f"Total embeddings so far: {len(all_embeddings)}")
-                except Exception as batch_error:
-                    logger.error(f"Error processing batch {batch_num}: {batch_error}", exc_info=True)
-                    raise
+        coro = self._generate_openai_embeddings_async(texts, batch_size)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
 
-            logger.info(f"Completed all batches - returning {len(all_embeddings)} embeddings")
-            return all_embeddings
+        # Called from inside an event loop: run the batches on a private loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
 
+    async def _generate_openai_embeddings_async(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Send OpenAI embedding batches concurrently, returning embeddings in input order."""
+        try:
+            from openai import AsyncOpenAI, RateLimitError
         except ImportError as import_error:
             logger.error(f"openai package not installed: {import_error}", exc_info=True)
             raise
+
+        openai_batch_size = min(batch_size * 10, OPENAI_MAX_INPUTS_PER_REQUEST)
+        batches = [texts[i:i + openai_batch_size] for i in range(0, len(texts), openai_batch_size)]
+        logger.info(
+            f"Generating {len(texts)} OpenAI embeddings in {len(batches)} batches "
+            f"(batch size {openai_batch_size}, concurrency {OPENAI_EMBEDDING_CONCURRENCY})"
+        )
+
+        semaphore = asyncio.Semaphore(OPENAI_EMBEDDING_CONCURRENCY)
+
+        async def embed_batch(client, batch_num: int, batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                for attempt in range(OPENAI_RATE_LIMIT_RETRIES + 1):
+                    try:
+                        response = await client.embeddings.create(input=batch, model=self.model_name)
+                        return [item.embedding for item in response.data]
+                    except RateLimitError:
+                        if attempt == OPENAI_RATE_LIMIT_RETRIES:
+                            raise
+                        delay = 2 ** attempt
+                        logger.warning(f"OpenAI rate limit on batch {batch_num}, retrying in {delay}s")
+                        await asyncio.sleep(delay)
+
+        try:
+            async with AsyncOpenAI(api_key=self.api_key) as client:
+                results = await asyncio.gather(
+                    *(embed_batch(client, n, batch) for n, batch in enumerate(batches, start=1))
+                )
         except Exception as e:
             logger.error(f"Failed to generate OpenAI batch embeddings: {e}", exc_info=True)
             raise
 
-    def _generate_ollama_embeddings(self, texts: List[str], batch_size: int) -> List[List[float]]:
-        """Generate embeddings using Ollama (processes one at a time)."""
-        self._initialize_ollama_client()
+        # Copy each batch straight into one preallocated buffer, in input order
+        all_embeddings = np.empty((len(texts), len(results[0][0])), dtype=np.float32)
+        for n, batch_embeddings in enumerate(results):
+            offset = n * openai_batch_size
+            all_embeddings[offset:offset + len(batch_embeddings)] = batch_embeddings
+        logger.info(f"Completed all batches - returning {len(all_embeddings)} embeddings")
+        return all_embeddings
 
-        try:
-            all_embeddings = []
+    def _generate_ollama_embeddings(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Generate embeddings using Ollama, several requests in flight at once."""
+        self._initialize_ollama_client()
 
-            # Ollama processes embeddings one at a time
-            for i, text in enumerate(texts):
-                if i % 10 == 0:  # Log progress every 10 texts
-                    logger.info(f"Processing Ollama embedding {i+1}/{len(texts)}")
+        # Newer Ollama servers embed a whole batch per /api/embed request; older ones
+        # only have the one-text /api/embeddings endpoint
+        if self._ollama_batch_supported is not False and hasattr(self._ollama_client, "embed"):
+            batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+            try:
+                with ThreadPoolExecutor(max_workers=OLLAMA_EMBEDDING_CONCURRENCY) as executor:
+                    results = list(executor.map(self._embed_ollama_batch, batches))
+                self._ollama_batch_supported = True
+                logger.info(f"Completed Ollama embeddings - returning {len(texts)} embeddings ({len(batches)} batch requests)")
+                return np.asarray([e for batch in results for e in batch], dtype=np.float32)
+            except Exception as e:
+                if self._ollama_batch_supported:
+                    logger.error(f"Failed to generate Ollama batch embeddings: {e}", exc_info=True)
+                    raise
+                if _is_missing_endpoint_error(e):
+                    logger.warning(f"Ollama batch embed endpoint unavailable, falling back to per-text requests: {e}")
+                    self._ollama_batch_supported = False
+                else:
+                    # Timeouts, a model still loading, 5xx: not proof the endpoint is
+                    # missing, so fall back for this call only and retry batching next time
+                    logger.warning(f"Ollama batch embed request failed, using per-text requests for this call: {e}")
 
-                response = self._ollama_client.embeddings(
-                    model=self.model_name,
-                    prompt=text
-                )
-                all_embeddings.append(response["embedding"])
+        try:
+            with ThreadPoolExecutor(max_workers=OLLAMA_EMBEDDING_CONCURRENCY) as executor:
+                results = list(executor.map(self._generate_ollama_embedding, texts))
 
-            logger.info(f"Completed Ollama embeddings - returning {len(all_embeddings)} embeddings")
-            return all_embeddings
+            logger.info(f"Completed Ollama embeddings - returning {len(results)} embeddings")
+            return np.asarray(results, dtype=np.float32)
 
         except Exception as e:
             logger.error(f"Failed to generate Ollama batch embeddings: {e}", exc_info=True)
             raise
 
+    def _embed_ollama_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed several texts in one /api/embed request."""
+        response = self._ollama_client.embed(model=self.model_name, input=batch)
+        return response["embeddings"]
+
     def chunk_text(
         self, text: str, chunk_size: int = 500, chunk_overlap: int = 50
     ) -> List[str]:
@@ -303,34 +481,36 @@ class EmbeddingService:
         Returns:
             List of text chunks
         """
-        logger.info(f"[CHUNK_TEXT] Entered function with text length: {len(text) if text else 0}, chunk_size: {chunk_size}, overlap: {chunk_overlap}")
-
         if not text or len(text) <= chunk_size:
-            logger.info(f"[CHUNK_TEXT] Text is short, returning single chunk or empty list")
             return [text] if text else []
 
-        logger.info(f"[CHUNK_TEXT] Starting chunking loop...")
+        # Find every boundary in one pass, then bisect per chunk instead of rescanning
+        # each window with rfind
+        sentence_starts = []
+        sentence_ends = []
+        for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+            sentence_starts.append(match.start())
+            sentence_ends.append(match.end())
+        spaces = [match.start() for match in _WORD_BOUNDARY_RE.finditer(text)]
+
         chunks = []
         start = 0
 
         while start < len(text):
-            logger.info(f"[CHUNK_TEXT] Loop iteration: start={start}, len(text)={len(text)}")
             # Find end of chunk
             end = start + chunk_size
 
             # If not at end, try to break at sentence or word boundary
             if end < len(text):
-                # Look for sentence boundary (. ! ?)
-                for punct in [". ", "! ", "? ", "\n\n"]:
-                    last_punct = text.rfind(punct, start, end)
-                    if last_punct > start:
-                        end = last_punct + len(punct)
-                        break
+                # Latest sentence boundary (. ! ? or blank line) ending within the window
+                i = bisect_right(sentence_ends, end) - 1
+                if i >= 0 and sentence_starts[i] > start:
+                    end = sentence_ends[i]
                 else:
                     # No sentence boundary, try word boundary
-                    last_space = text.rfind(" ", start, end)
-                    if last_space > start:
-                        end = last_space
+                    i = bisect_left(spaces, end) - 1
+                    if i >= 0 and spaces[i] > start:
+                        end = spaces[i]
 
             chunk = text[start:end].strip()
             if chunk:
@@ -339,4 +519,33 @@ class EmbeddingService:
             # Move start position with overlap
             start = end - chunk_overlap if end < len(text) else len(text)
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Split {len(text)} characters into {len(chunks)} chunks (size {chunk_size}, overlap {chunk_overlap})")
         return chunks
+
+
+@lru_cache(maxsize=1)
+def get_embedding_service() -> EmbeddingService:
+    """
+    Get the process-wide embedding service configured from settings.
+
+    The service is stateless apart from its lazily loaded model/client, so one
+    instance is shared and the local model is loaded at most once per process.
+    """
+    from app.config import settings
+
+    return EmbeddingService(
+        provider=settings.EMBEDDING_PROVIDER,
+        model_name=settings.EMBEDDING_MODEL,
+        api_key=settings.OPENAI_API_KEY if settings.EMBEDDING_PROVIDER == "openai" else None,
+        dimension=settings.EMBEDDING_DIMENSION,
+        base_url=settings.LLM_BASE_URL if settings.EMBEDDING_PROVIDER == "ollama" else None,
+    )
+
+
+def preload_embedding_model() -> None:
+    """Load the configured local embedding model now instead of on the first request."""
+    service = get_embedding_service()
+    if service.provider in ["openai", "ollama"]:
+        return
+    service._load_model()
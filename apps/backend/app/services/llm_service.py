@@ -1,11 +1,169 @@
 """LLM service for metadata extraction and auto-tagging."""
+import asyncio
+import hashlib
 import logging
-import json
-from typing import Dict, Any, Optional, List
+import re
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from enum import Enum
 
+import orjson
+
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
+try:
+    import json_repair
+except ImportError:
+    json_repair = None
+
+# SDK clients shared by every LLMService in the process, keyed by
+# (provider, base_url, api_key), so back-to-back calls (e.g. one Celery task per
+# document) reuse pooled keep-alive connections instead of new TCP/TLS handshakes
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Connection pool for the OpenAI client's httpx transport
+OPENAI_HTTP_LIMITS = {"max_keepalive_connections": 20, "max_connections": 50, "keepalive_expiry": 30.0}
+OPENAI_HTTP_TIMEOUT = 120.0
+
+# Default cap on in-flight LLM requests for the async batch API
+LLM_MAX_CONCURRENCY = 8
+
+# Metadata extraction runs at temperature 0 on every provider, so a response can be
+# reused for the same (provider, model, prompt), e.g. when a document is reprocessed.
+# Only responses that parsed into metadata are cached. They are kept in a
+# process-wide LRU in front of Redis, which shares them across workers.
+LLM_RESPONSE_CACHE_SIZE = 1024
+LLM_RESPONSE_CACHE_TTL_SECONDS = 86400
+LLM_RESPONSE_CACHE_PREFIX = "cartulary:llm:"
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Budget for the document text in a metadata extraction prompt. OpenAI models are
+# truncated by tokens with tiktoken; other providers (and OpenAI without tiktoken)
+# by UTF-8 bytes, roughly four per token, which also bounds multi-byte CJK text
+METADATA_INPUT_TOKENS = 1000
+METADATA_INPUT_BYTES = 4000
+
+# Markdown code fences around (or between) parts of an LLM's JSON answer
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*\n?|\n?```\s*$", re.MULTILINE)
+# Outermost {...} span, for answers with prose before or after the object
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Metadata extraction prompt, filled in once per call by _build_extraction_prompt
+_EXTRACTION_TEMPLATE = """Analyze the following document and extract structured metadata.
+
+Document text:
+{text}
+{filename_block}{tags_block}
+Please extract the following information and respond ONLY with a valid JSON object (no markdown, no explanation):
+
+{{
+  "title": "The document's title or subject (50 chars max)",
+  "correspondent": "The sender, author, or organization (if identifiable)",
+  "document_date": "The document date in YYYY-MM-DD format (if found)",
+  "document_type": "The type of document (e.g., invoice, letter, receipt, report, contract)",
+  "summary": "A brief 1-2 sentence summary",
+  "suggested_tags": ["tag1", "tag2", "tag3"]
+}}
+
+Guidelines:
+- Use "Unknown" if information cannot be determined
+- For document_date, use null if no date is found
+- For summary: If the document is primarily about one specific person (e.g., birth certificate, death certificate, medical record, diploma), include that person's full name in the summary. For example: "Birth certificate for John Smith, born January 15, 1990"
+- For suggested_tags:
+  * Suggest 3-5 relevant tags based on content
+  * If any of the existing tags listed above are absolutely relevant to this document, use those exact tag names
+  * Suggest new tags if the existing tags are not relevant or if additional categorization would be helpful
+  * Prefer existing tags when they accurately describe the document's content, subject, or category
+  * Consider all the words in a tag, not just a single word when determining its relevance. For example for the tag "commitment form", if the document is a form for membership to an organization, then the tag isn't relevant.
+  * DO NOT return existing tags that are not relevant to the document. They ABSOLUTELY must be relevant to the document!
+- Keep responses concise and factual
+- Return ONLY the JSON object, nothing else
+"""
+
+# Deterministic sampling for metadata extraction, in each SDK's request format
+GEMINI_METADATA_GENERATION_CONFIG = {"temperature": 0.0}
+OLLAMA_METADATA_OPTIONS = {"temperature": 0}
+
+METADATA_SYSTEM_PROMPT = (
+    "You are a document metadata extraction assistant. "
+    "Extract structured information from documents and return it as JSON."
+)
+
+
+@lru_cache(maxsize=1)
+def _get_response_redis():
+    """Return the Redis client for the shared response cache, or None if unavailable."""
+    try:
+        import redis
+
+        return redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=1.0,
+            socket_connect_timeout=1.0,
+        )
+    except Exception as e:
+        logger.warning(f"LLM response cache will not use Redis: {e}")
+        return None
+
+
+@lru_cache(maxsize=8)
+def _get_token_encoder(model_name: str):
+    """Return the tiktoken encoding for an OpenAI model, or None if tiktoken is missing."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # Models newer than the installed tiktoken
+        return tiktoken.get_encoding("o200k_base")
+
+
+class _JsonObjectScanner:
+    """Track brace depth across streamed text to spot the end of the first JSON object."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, delta: str) -> int:
+        """
+        Scan the next piece of streamed text.
+
+        Returns:
+            Index just past the object's closing brace within delta, or -1 if the
+            object has not been closed yet
+        """
+        for i, char in enumerate(delta):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"' and self.started:
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -39,8 +197,14 @@ class LLMService:
         self.api_key = api_key
         self.base_url = base_url or self._get_default_base_url()
 
-        # Initialize provider-specific client
-        self.client = self._initialize_client()
+        # Initialize provider-specific client (shared per process, see _CLIENT_CACHE)
+        self._client_key = (self.provider.value, base_url, api_key)
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(self._client_key)
+            if client is None:
+                client = self._initialize_client(base_url)
+                _CLIENT_CACHE[self._client_key] = client
+        self.client = client
 
     def _get_default_base_url(self) -> str:
         """Get default base URL for provider."""
@@ -48,13 +212,38 @@ class LLMService:
             return "http://localhost:11434"
         return ""
 
-    def _initialize_client(self):
+    def close(self) -> None:
+        """
+        Close the shared client's connection pool.
+
+        The client is dropped from the process cache, so services created afterwards
+        (or this one, re-created) open a fresh pool.
+        """
+        with _CLIENT_CACHE_LOCK:
+            if _CLIENT_CACHE.get(self._client_key) is self.client:
+                del _CLIENT_CACHE[self._client_key]
+        # OpenAI clients have close(); older ollama.Client versions only expose
+        # their httpx client as _client; the Gemini module holds no pool
+        close = getattr(self.client, "close", None) or getattr(
+            getattr(self.client, "_client", None), "close", None
+        )
+        if close is not None:
+            close()
+
+    def _initialize_client(self, host: Optional[str] = None):
         """Initialize provider-specific client."""
         if self.provider == LLMProvider.OPENAI:
             try:
+                import httpx
                 from openai import OpenAI
 
-                return OpenAI(api_key=self.api_key)
+                return OpenAI(
+                    api_key=self.api_key,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(**OPENAI_HTTP_LIMITS),
+                        timeout=OPENAI_HTTP_TIMEOUT,
+                    ),
+                )
             except ImportError:
                 raise ImportError(
                     "OpenAI library not installed. Install with: pip install openai"
@@ -77,7 +266,9 @@ class LLMService:
             try:
                 import ollama
 
-                return ollama
+                # Without an explicit base URL the client falls back to OLLAMA_HOST,
+                # as the module-level ollama functions did
+                return ollama.Client(host=host)
             except ImportError:
                 raise ImportError(
                     "Ollama library not installed. Install with: pip install ollama"
@@ -110,74 +301,146 @@ class LLMService:
         prompt = self._build_extraction_prompt(text, filename, existing_tags)
 
         try:
-            response_text = self._call_llm(prompt)
-            metadata = self._parse_metadata_response(response_text)
+            cache_key = self._response_cache_key(prompt)
+            response_text = self._get_cached_response(cache_key)
+            if response_text is not None:
+                metadata = self._parse_metadata_response(response_text)
+            else:
+                response_text = self._call_llm(prompt)
+                metadata = self._try_parse_metadata_response(response_text)
+                if metadata is None:
+                    metadata = self._get_empty_metadata()
+                else:
+                    self._cache_response(cache_key, response_text)
             logger.info(f"Extracted metadata using {self.provider}: {metadata}")
             return metadata
         except Exception as e:
             logger.error(f"Failed to extract metadata with {self.provider}: {e}")
             return self._get_empty_metadata()
 
-    def _build_extraction_prompt(
-        self, text: str, filename: Optional[str] = None, existing_tags: Optional[List[str]] = None
-    ) -> str:
-        """Build prompt for metadata extraction."""
-        # Truncate text if too long (keep first 4000 chars for context)
-        truncated_text = text[:4000] if len(text) > 4000 else text
+    async def extract_metadata_batch(
+        self,
+        documents: List[Tuple[str, Optional[str]]],
+        existing_tags: Optional[List[str]] = None,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for several documents concurrently.
 
-        prompt = f"""Analyze the following document and extract structured metadata.
+        Each document gets its own LLM request, with at most max_concurrency in
+        flight at once. A failed document gets empty metadata, as in extract_metadata().
 
-Document text:
-{truncated_text}
-"""
+        Args:
+            documents: (text, filename) pairs; filename may be None
+            existing_tags: List of existing tag names to prefer (optional)
+            max_concurrency: Maximum number of simultaneous LLM requests
 
-        if filename:
-            prompt += f"\nOriginal filename: {filename}\n"
+        Returns:
+            Metadata dictionaries in the same order as documents
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async_client = self._initialize_async_client()
 
-        if existing_tags and len(existing_tags) > 0:
-            prompt += f"\nExisting tags in the system: {', '.join(existing_tags)}\n"
+        async def extract_one(text: str, filename: Optional[str]) -> Dict[str, Any]:
+            prompt = self._build_extraction_prompt(text, filename, existing_tags)
+            try:
+                cache_key = self._response_cache_key(prompt)
+                response_text = await asyncio.to_thread(self._get_cached_response, cache_key)
+                if response_text is not None:
+                    return self._parse_metadata_response(response_text)
+
+                async with semaphore:
+                    response_text = await self._call_llm_async(async_client, prompt)
+                metadata = self._try_parse_metadata_response(response_text)
+                if metadata is None:
+                    return self._get_empty_metadata()
+                await asyncio.to_thread(self._cache_response, cache_key, response_text)
+                return metadata
+            except Exception as e:
+                logger.error(f"Failed to extract metadata with {self.provider}: {e}")
+                return self._get_empty_metadata()
 
-        prompt += """
-Please extract the following information and respond ONLY with a valid JSON object (no markdown, no explanation):
+        try:
+            return await asyncio.gather(
+                *(extract_one(text, filename) for text, filename in documents)
+            )
+        finally:
+            close = getattr(async_client, "close", None)
+            if close is not None:
+                await close()
+
+    def _response_cache_key(self, prompt: str) -> str:
+        """Hash the provider, model and prompt into a response cache key."""
+        return hashlib.blake2b(
+            f"{self.provider.value}|{self.model_name}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Look up a response in the in-process cache, then in Redis."""
+        with _response_cache_lock:
+            response_text = _response_cache.get(key)
+            if response_text is not None:
+                _response_cache.move_to_end(key)
+                return response_text
+
+        redis_client = _get_response_redis()
+        if redis_client is None:
+            return None
+        try:
+            response_text = redis_client.get(LLM_RESPONSE_CACHE_PREFIX + key)
+        except Exception as e:
+            logger.debug(f"LLM response cache lookup failed: {e}")
+            return None
+        if response_text is not None:
+            self._remember_response(key, response_text)
+        return response_text
+
+    def _cache_response(self, key: str, response_text: str) -> None:
+        """Store a response in the in-process cache and in Redis."""
+        self._remember_response(key, response_text)
+        redis_client = _get_response_redis()
+        if redis_client is None:
+            return
+        try:
+            redis_client.setex(
+                LLM_RESPONSE_CACHE_PREFIX + key, LLM_RESPONSE_CACHE_TTL_SECONDS, response_text
+            )
+        except Exception as e:
+            logger.debug(f"LLM response cache store failed: {e}")
+
+    @staticmethod
+    def _remember_response(key: str, response_text: str) -> None:
+        """Add a response to the in-process LRU, evicting the oldest entries."""
+        with _response_cache_lock:
+            _response_cache[key] = response_text
+            _response_cache.move_to_end(key)
+            while len(_response_cache) > LLM_RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+
+    def _initialize_async_client(self):
+        """Create an asyncio client for the provider (bound to the running loop)."""
+        if self.provider == LLMProvider.OPENAI:
+            from openai import AsyncOpenAI
 
-{
-  "title": "The document's title or subject (50 chars max)",
-  "correspondent": "The sender, author, or organization (if identifiable)",
-  "document_date": "The document date in YYYY-MM-DD format (if found)",
-  "document_type": "The type of document (e.g., invoice, letter, receipt, report, contract)",
-  "summary": "A brief 1-2 sentence summary",
-  "suggested_tags": ["tag1", "tag2", "tag3"]
-}
+            return AsyncOpenAI(api_key=self.api_key, timeout=OPENAI_HTTP_TIMEOUT)
 
-Guidelines:
-- Use "Unknown" if information cannot be determined
-- For document_date, use null if no date is found
-- For summary: If the document is primarily about one specific person (e.g., birth certificate, death certificate, medical record, diploma), include that person's full name in the summary. For example: "Birth certificate for John Smith, born January 15, 1990"
-- For suggested_tags:
-  * Suggest 3-5 relevant tags based on content
-  * If any of the existing tags listed above are absolutely relevant to this document, use those exact tag names
-  * Suggest new tags if the existing tags are not relevant or if additional categorization would be helpful
-  * Prefer existing tags when they accurately describe the document's content, subject, or category
-  * Consider all the words in a tag, not just a single word when determining its relevance. For example for the tag "commitment form", if the document is a form for membership to an organization, then the tag isn't relevant.
-  * DO NOT return existing tags that are not relevant to the document. They ABSOLUTELY must be relevant to the document!
-- Keep responses concise and factual
-- Return ONLY the JSON object, nothing else
-"""
-        return prompt
+        elif self.provider == LLMProvider.GEMINI:
+            # Gemini's async calls live on the already-configured module
+            return None
 
-    def _call_llm(self, prompt: str) -> str:
-        """Call LLM with the given prompt."""
+        elif self.provider == LLMProvider.OLLAMA:
+            import ollama
+
+            return ollama.AsyncClient(host=self._client_key[1])
+
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+    async def _call_llm_async(self, async_client, prompt: str) -> str:
+        """Async counterpart of _call_llm."""
         if self.provider == LLMProvider.OPENAI:
-            response = self.client.chat.completions.create(
+            response = await async_client.chat.completions.create(
                 model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a document metadata extraction assistant. "
-                        "Extract structured information from documents and return it as JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=self._metadata_messages(prompt),
                 temperature=0.0,  # Deterministic for metadata extraction
                 max_tokens=500,
             )
@@ -185,41 +448,124 @@ Guidelines:
 
         elif self.provider == LLMProvider.GEMINI:
             model = self.client.GenerativeModel(self.model_name)
-            response = model.generate_content(prompt)
+            response = await model.generate_content_async(
+                prompt, generation_config=GEMINI_METADATA_GENERATION_CONFIG
+            )
             return response.text
 
         elif self.provider == LLMProvider.OLLAMA:
-            response = self.client.chat(
+            response = await async_client.chat(
                 model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a document metadata extraction assistant. "
-                        "Extract structured information from documents and return it as JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=self._metadata_messages(prompt),
+                options=OLLAMA_METADATA_OPTIONS,
             )
             return response["message"]["content"]
 
         raise ValueError(f"Unsupported provider: {self.provider}")
 
+    @staticmethod
+    def _metadata_messages(prompt: str) -> List[Dict[str, str]]:
+        """Chat messages for a metadata extraction prompt."""
+        return [
+            {"role": "system", "content": METADATA_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _build_extraction_prompt(
+        self, text: str, filename: Optional[str] = None, existing_tags: Optional[List[str]] = None
+    ) -> str:
+        """Build prompt for metadata extraction."""
+        truncated_text = self._truncate_document_text(text)
+
+        filename_block = f"\nOriginal filename: {filename}\n" if filename else ""
+        tags_block = (
+            f"\nExisting tags in the system: {', '.join(existing_tags)}\n" if existing_tags else ""
+        )
+        return _EXTRACTION_TEMPLATE.format(
+            text=truncated_text, filename_block=filename_block, tags_block=tags_block
+        )
+
+    def _truncate_document_text(self, text: str) -> str:
+        """Cut document text down to the metadata prompt's input budget."""
+        encoder = (
+            _get_token_encoder(self.model_name) if self.provider == LLMProvider.OPENAI else None
+        )
+        # Only a prefix can survive, so don't encode all of a huge OCR text: tokens
+        # average about four characters, and sixteen leaves ample headroom
+        if encoder is not None:
+            token_ids = encoder.encode(text[: METADATA_INPUT_TOKENS * 16], disallowed_special=())
+            return encoder.decode(token_ids[:METADATA_INPUT_TOKENS])
+        # A UTF-8 character is at least one byte, so the byte budget fits in as many chars
+        head = text[:METADATA_INPUT_BYTES].encode("utf-8")
+        return head[:METADATA_INPUT_BYTES].decode("utf-8", "ignore")
+
+    def _call_llm(self, prompt: str) -> str:
+        """
+        Call LLM with the given prompt.
+
+        The response is streamed and the stream is closed as soon as the JSON
+        object is complete, so trailing text (closing code fences, explanations)
+        is neither waited for nor kept.
+        """
+        scanner = _JsonObjectScanner()
+        parts: List[str] = []
+        with closing(self._call_llm_stream(prompt)) as stream:
+            for delta in stream:
+                end = scanner.feed(delta)
+                if end >= 0:
+                    parts.append(delta[:end])
+                    break
+                parts.append(delta)
+        return "".join(parts)
+
+    def _call_llm_stream(self, prompt: str) -> Iterator[str]:
+        """Stream the LLM response to a prompt as text deltas."""
+        if self.provider == LLMProvider.OPENAI:
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=self._metadata_messages(prompt),
+                temperature=0.0,  # Deterministic for metadata extraction
+                max_tokens=500,
+                stream=True,
+            )
+            with closing(stream):
+                for chunk in stream:
+                    if chunk.choices:
+                        yield chunk.choices[0].delta.content or ""
+
+        elif self.provider == LLMProvider.GEMINI:
+            model = self.client.GenerativeModel(self.model_name)
+            for chunk in model.generate_content(
+                prompt, generation_config=GEMINI_METADATA_GENERATION_CONFIG, stream=True
+            ):
+                yield chunk.text
+
+        elif self.provider == LLMProvider.OLLAMA:
+            for chunk in self.client.chat(
+                model=self.model_name,
+                messages=self._metadata_messages(prompt),
+                options=OLLAMA_METADATA_OPTIONS,
+                stream=True,
+            ):
+                yield chunk["message"]["content"]
+
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+
     def _parse_metadata_response(self, response_text: str) -> Dict[str, Any]:
-        """Parse LLM response into structured metadata."""
+        """Parse LLM response into structured metadata (empty metadata if unparsable)."""
+        metadata = self._try_parse_metadata_response(response_text)
+        return metadata if metadata is not None else self._get_empty_metadata()
+
+    def _try_parse_metadata_response(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """Parse LLM response into structured metadata, or None if it is unparsable."""
         try:
             # Remove markdown code blocks if present
-            cleaned = response_text.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
-            cleaned = cleaned.strip()
+            cleaned = _CODE_FENCE_RE.sub("", response_text).strip()
 
             # Parse JSON
             logger.info(f"Parsing LLM metadata response (length: {len(cleaned)} chars): {cleaned}...")
-            metadata = json.loads(cleaned)
+            metadata = self._load_json_object(cleaned)
 
             # Validate and normalize
             return {
@@ -230,13 +576,43 @@ Guidelines:
                 "summary": metadata.get("summary", "")[:1000],
                 "suggested_tags": metadata.get("suggested_tags", [])[:10],  # Max 10 tags
             }
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from LLM response: {e}")
             logger.debug(f"Response was: {response_text}")
-            return self._get_empty_metadata()
+            return None
         except Exception as e:
             logger.error(f"Error parsing metadata: {e}")
-            return self._get_empty_metadata()
+            return None
+
+    @staticmethod
+    def _load_json_object(cleaned: str) -> Dict[str, Any]:
+        """
+        Parse the JSON object in an LLM answer.
+
+        Tries the text as-is, then the outermost {...} span (dropping surrounding
+        prose), then json_repair if installed for malformed JSON such as trailing commas.
+
+        Raises:
+            orjson.JSONDecodeError: If no stage yields a JSON object
+        """
+        try:
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError as e:
+            error = e
+
+        match = _JSON_OBJECT_RE.search(cleaned)
+        candidate = match.group(0) if match else cleaned
+        if match:
+            try:
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError as e:
+                error = e
+
+        if json_repair is not None:
+            repaired = json_repair.loads(candidate)
+            if isinstance(repaired, dict) and repaired:
+                return repaired
+        raise error
 
     def _get_empty_metadata(self) -> Dict[str, Any]:
         """Return empty metadata structure."""
@@ -265,6 +641,10 @@ Guidelines:
 
         Returns:
             Generated answer text
+
+        Raises:
+            Exception: If the provider call fails (logged, then re-raised so callers
+                can tell a failure from an answer)
         """
         # Build context from chunks
         context_text = "\n\n---\n\n".join(
@@ -340,4 +720,4 @@ Instructions:
             
         except Exception as e:
             logger.error(f"Failed to generate answer with {self.provider}: {e}")
-            return "I encountered an error while trying to answer your question. Please try again."
+            raise
@@ -1,16 +1,89 @@
 """Notification service for real-time event broadcasting."""
-import json
+import asyncio
+import atexit
 import logging
-from datetime import datetime
-from typing import Any, Dict
+import os
+import queue
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import orjson
 import redis
 import redis.asyncio as aioredis
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Events published by the notify_<name> / notify_<name>_sync methods:
+# name -> (event type, payload fields in argument order)
+_EVENTS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "document_created": ("document.created", ("document_id", "user_id")),
+    "status_changed": ("document.status_changed", ("document_id", "old_status", "new_status")),
+    "document_updated": ("document.updated", ("document_id", "user_id")),
+    "document_deleted": ("document.deleted", ("document_id", "user_id")),
+}
+
+# With the publish queue enabled (see NotificationService.enable_publish_queue),
+# events are queued and sent by a background flusher (a daemon thread for
+# publish_event_sync, an asyncio task for publish_event) through a non-transactional
+# pipeline: up to PUBLISH_BATCH_SIZE events, or whatever arrived within
+# PUBLISH_BATCH_WINDOW_SECONDS of the first, per Redis round-trip
+PUBLISH_BATCH_SIZE = 64
+PUBLISH_BATCH_WINDOW_SECONDS = 0.01
+
+# (event type, data, serialized event)
+_QueuedEvent = Tuple[str, Dict[str, Any], bytes]
+
+@lru_cache(maxsize=None)
+def _event_prefix(event_type: str) -> bytes:
+    """Serialized start of an event, up to its data field (constant per event type)."""
+    return b'{"type":' + orjson.dumps(event_type) + b',"data":'
+
+
+# (epoch second, serialized '"YYYY-MM-DDTHH:MM:SS' for it), replaced once per second
+_timestamp_second: Tuple[int, bytes] = (-1, b"")
+
+
+def _utc_timestamp() -> bytes:
+    """
+    Serialized naive UTC ISO timestamp with microseconds, taken from time.time_ns().
+
+    Only the date and time-of-day part is formatted, once per second; each call
+    just appends the microseconds.
+    """
+    global _timestamp_second
+    second, microsecond = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _timestamp_second
+    if cached_second != second:
+        prefix = time.strftime('"%Y-%m-%dT%H:%M:%S', time.gmtime(second)).encode()
+        _timestamp_second = (second, prefix)
+    return b'%s.%06d"' % (prefix, microsecond)
+
+
+def _event(name: str, *values: Any) -> Tuple[str, Dict[str, Any]]:
+    """Return (event type, data) for an _EVENTS entry and its field values."""
+    event_type, fields = _EVENTS[name]
+    return event_type, dict(zip(fields, values))
+
+
+def _serialize_event(event_type: str, data: Dict[str, Any]) -> bytes:
+    """
+    Serialize an event as {"type", "data", "timestamp"} JSON.
+
+    orjson writes UUIDs and datetimes as strings itself, so data may hold them
+    unconverted.
+    """
+    return (
+        _event_prefix(event_type)
+        + orjson.dumps(data)
+        + b',"timestamp":'
+        + _utc_timestamp()
+        + b"}"
+    )
+
 
 class NotificationService:
     """Service for publishing real-time events via Redis pub/sub."""
@@ -20,6 +93,15 @@ class NotificationService:
     def __init__(self):
         self.redis = None
         self.sync_redis = None
+        # Off by default: publishes complete (or raise) before returning
+        self.queue_publishes = False
+        self._sync_queue: "queue.Queue[_QueuedEvent]" = queue.Queue()
+        self._sync_flusher: Optional[threading.Thread] = None
+        # Process that started the flusher; a forked worker must start its own
+        self._sync_flusher_pid: Optional[int] = None
+        self._sync_flusher_lock = threading.Lock()
+        self._async_queue: Optional["asyncio.Queue[_QueuedEvent]"] = None
+        self._async_flusher: Optional[asyncio.Task] = None
 
     async def get_redis(self):
         """Get or create async Redis connection."""
@@ -37,95 +119,174 @@ class NotificationService:
             )
         return self.sync_redis
 
+    def enable_publish_queue(self):
+        """
+        Queue published events and send them in pipelined batches from the background.
+
+        publish_event/publish_event_sync then return before the event reaches Redis,
+        and a failed publish is only logged by the flusher, not raised to the caller.
+        Call flush_pending_sync() to wait until queued sync events have been sent.
+        Celery worker processes enable this (see app.tasks.celery_app), where bulk
+        ingest publishes a burst of status events.
+        """
+        self.queue_publishes = True
+
     async def publish_event(self, event_type: str, data: Dict[str, Any]):
         """Publish event to Redis pub/sub channel (async)."""
-        event = {
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-        redis_client = await self.get_redis()
-        await redis_client.publish(self.CHANNEL, json.dumps(event))
-        logger.debug(f"Published event: {event_type}")
+        payload = _serialize_event(event_type, data)
+        if not self.queue_publishes:
+            redis_client = await self.get_redis()
+            await redis_client.publish(self.CHANNEL, payload)
+            logger.debug(f"Published event: {event_type}")
+            return
+
+        loop = asyncio.get_running_loop()
+        flusher = self._async_flusher
+        if flusher is None or flusher.done() or flusher.get_loop() is not loop:
+            self._async_queue = asyncio.Queue()
+            self._async_flusher = loop.create_task(self._flush_async())
+        self._async_queue.put_nowait((event_type, data, payload))
 
     def publish_event_sync(self, event_type: str, data: Dict[str, Any]):
         """Publish event to Redis pub/sub channel (sync)."""
-        event = {
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-        redis_client = self.get_sync_redis()
-        result = redis_client.publish(self.CHANNEL, json.dumps(event))
-        logger.info(f"Published event (sync) to {result} subscribers: {event_type} - {data}")
+        payload = _serialize_event(event_type, data)
+        if not self.queue_publishes:
+            result = self.get_sync_redis().publish(self.CHANNEL, payload)
+            logger.info(f"Published event (sync) to {result} subscribers: {event_type} - {data}")
+            return
+
+        self._ensure_sync_flusher()
+        self._sync_queue.put((event_type, data, payload))
+
+    async def _flush_async(self):
+        """Flusher task: send queued async events in pipelined batches."""
+        event_queue = self._async_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await event_queue.get()]
+            deadline = loop.time() + PUBLISH_BATCH_WINDOW_SECONDS
+            while len(batch) < PUBLISH_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(event_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                redis_client = await self.get_redis()
+                pipe = redis_client.pipeline(transaction=False)
+                for _, _, payload in batch:
+                    pipe.publish(self.CHANNEL, payload)
+                await pipe.execute()
+                for event_type, _, _ in batch:
+                    logger.debug(f"Published event: {event_type}")
+            except Exception as e:
+                logger.error(f"Failed to publish {len(batch)} events: {e}")
+
+    def _ensure_sync_flusher(self):
+        """Start the sync flusher thread on first use in this process."""
+        pid = os.getpid()
+        if self._sync_flusher_pid == pid:
+            return
+        with self._sync_flusher_lock:
+            if self._sync_flusher_pid != pid:
+                # Events queued before a fork belong to the parent's flusher
+                self._sync_queue = queue.Queue()
+                self._sync_flusher = threading.Thread(
+                    target=self._flush_sync_forever, name="notification-flusher", daemon=True
+                )
+                self._sync_flusher.start()
+                self._sync_flusher_pid = pid
+                atexit.register(self.flush_pending_sync)
+
+    def _flush_sync_forever(self):
+        """Daemon loop: block for the next event, then send it with whatever follows."""
+        while True:
+            batch = [self._sync_queue.get()]
+            deadline = time.monotonic() + PUBLISH_BATCH_WINDOW_SECONDS
+            while len(batch) < PUBLISH_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._sync_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._publish_batch_sync(batch)
+            for _ in batch:
+                self._sync_queue.task_done()
+
+    def flush_pending_sync(self):
+        """
+        Send any queued sync events now and wait for the flusher's in-flight batch.
+
+        Runs at interpreter exit and on Celery's worker_process_shutdown, since
+        prefork children leave through os._exit without running atexit hooks.
+        """
+        if self._sync_flusher_pid != os.getpid():
+            return
+        batch = []
+        while True:
+            try:
+                batch.append(self._sync_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._publish_batch_sync(batch)
+            for _ in batch:
+                self._sync_queue.task_done()
+        self._sync_queue.join()
+
+    def _publish_batch_sync(self, batch: List[_QueuedEvent]):
+        """Send a batch of queued events in one pipelined round-trip."""
+        try:
+            pipe = self.get_sync_redis().pipeline(transaction=False)
+            for _, _, payload in batch:
+                pipe.publish(self.CHANNEL, payload)
+            results = pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to publish {len(batch)} events (sync): {e}")
+            return
+        for (event_type, data, _), result in zip(batch, results):
+            logger.info(f"Published event (sync) to {result} subscribers: {event_type} - {data}")
 
     async def notify_document_created(self, document_id: UUID, user_id: UUID):
         """Notify that a document was created (async)."""
-        await self.publish_event(
-            "document.created",
-            {"document_id": str(document_id), "user_id": str(user_id)},
-        )
+        await self.publish_event(*_event("document_created", document_id, user_id))
 
     def notify_document_created_sync(self, document_id: UUID, user_id: UUID):
         """Notify that a document was created (sync)."""
-        self.publish_event_sync(
-            "document.created",
-            {"document_id": str(document_id), "user_id": str(user_id)},
-        )
+        self.publish_event_sync(*_event("document_created", document_id, user_id))
 
     async def notify_status_changed(
         self, document_id: UUID, old_status: str, new_status: str
     ):
         """Notify that document status changed (async)."""
-        await self.publish_event(
-            "document.status_changed",
-            {
-                "document_id": str(document_id),
-                "old_status": old_status,
-                "new_status": new_status,
-            },
-        )
+        await self.publish_event(*_event("status_changed", document_id, old_status, new_status))
 
     def notify_status_changed_sync(
         self, document_id: UUID, old_status: str, new_status: str
     ):
         """Notify that document status changed (sync)."""
-        self.publish_event_sync(
-            "document.status_changed",
-            {
-                "document_id": str(document_id),
-                "old_status": old_status,
-                "new_status": new_status,
-            },
-        )
+        self.publish_event_sync(*_event("status_changed", document_id, old_status, new_status))
 
     async def notify_document_updated(self, document_id: UUID, user_id: UUID):
         """Notify that document was updated (async)."""
-        await self.publish_event(
-            "document.updated",
-            {"document_id": str(document_id), "user_id": str(user_id)},
-        )
+        await self.publish_event(*_event("document_updated", document_id, user_id))
 
     def notify_document_updated_sync(self, document_id: UUID, user_id: UUID):
         """Notify that document was updated (sync)."""
-        self.publish_event_sync(
-            "document.updated",
-            {"document_id": str(document_id), "user_id": str(user_id)},
-        )
+        self.publish_event_sync(*_event("document_updated", document_id, user_id))
 
     async def notify_document_deleted(self, document_id: UUID, user_id: UUID):
         """Notify that document was deleted (async)."""
-        await self.publish_event(
-            "document.deleted",
-            {"document_id": str(document_id), "user_id": str(user_id)},
-        )
+        await self.publish_event(*_event("document_deleted", document_id, user_id))
 
     def notify_document_deleted_sync(self, document_id: UUID, user_id: UUID):
         """Notify that document was deleted (sync)."""
-        self.publish_event_sync(
-            "document.deleted",
-            {"document_id": str(document_id), "user_id": str(user_id)},
-        )
+        self.publish_event_sync(*_event("document_deleted", document_id, user_id))
 
 
 notification_service = NotificationService()
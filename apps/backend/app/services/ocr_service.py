@@ -1,14 +1,24 @@
 """OCR service for extracting text from documents using LLM vision."""
 import logging
 import base64
+import os
 import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Pages of a PDF sent to the vision model at once. Each call is a network round-trip
+# to Ollama, so pages are rendered one after another (PyMuPDF documents are not
+# thread-safe) while earlier pages are still being read by the model. At most
+# VISION_OCR_PAGES_AHEAD rendered page images wait on disk for OCR at a time.
+VISION_OCR_CONCURRENCY = 4
+VISION_OCR_PAGES_AHEAD = VISION_OCR_CONCURRENCY * 2
+
 
 class OCRService:
     """Service for LLM vision-based text extraction."""
@@ -137,6 +147,14 @@ class OCRService:
             logger.error(f"Failed to extract text from image {image_path}: {type(e).__name__}: {str(e)}", exc_info=True)
             return None
 
+    def _extract_text_from_page_image(self, image_path: str) -> Optional[str]:
+        """Run vision OCR on a rendered PDF page image, then delete the image."""
+        try:
+            return self._extract_text_from_image(image_path)
+        finally:
+            # Clean up temp file
+            Path(image_path).unlink(missing_ok=True)
+
     def _extract_text_from_pdf(self, pdf_path: str, force_ocr: bool = False) -> Optional[str]:
         """
         Extract text from PDF file using LLM vision.
@@ -172,64 +190,88 @@ class OCRService:
 
             all_text = []
             processed_pages = []
-
-            for page_num in range(page_count):
-                try:
-                    page = doc[page_num]
-
-                    text = None
-                    
-                    # If force_ocr is True, skip embedded text extraction entirely
-                    if force_ocr:
-                        logger.info(f"Page {page_num + 1}: Forcing vision OCR (ignoring embedded text)")
-                    else:
-                        # First try to extract embedded text
-                        text = page.get_text()
-
-                    # Use vision OCR if: forced, no embedded text, or embedded text too short
-                    should_use_vision_ocr = force_ocr or (not text or len(text.strip()) < 50)
-                    
-                    if should_use_vision_ocr and self.enabled:
-                        if not force_ocr:
-                            logger.info(f"Page {page_num + 1}: Embedded text too short ({len(text.strip()) if text else 0} chars), attempting vision OCR")
-                        
-                        self._initialize_client()
-                        if self._ollama_client:
-                            # Convert page to image with unique temp file to avoid collisions
-                            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better quality
-                            
-                            # Use tempfile to create unique file per page/document
-                            fd, img_path = tempfile.mkstemp(suffix=".png", prefix=f"ocr_page_{page_num}_")
-                            import os
-                            os.close(fd)  # Close file descriptor, we'll write with PyMuPDF
-                            
-                            pix.save(img_path)
-                            logger.info(f"Page {page_num + 1}: Saved page image to {img_path}, calling Ollama vision API...")
-
-                            # Run vision OCR on the image
-                            vision_text = self._extract_text_from_image(img_path)
+            # (page number, embedded text, pending vision OCR)
+            pages: List[Tuple[int, Optional[str], Optional[Future]]] = []
+
+            # Taken before rendering a page image, given back once its OCR finishes
+            render_slots = threading.BoundedSemaphore(VISION_OCR_PAGES_AHEAD)
+
+            with ThreadPoolExecutor(max_workers=VISION_OCR_CONCURRENCY) as executor:
+                for page_num in range(page_count):
+                    try:
+                        page = doc[page_num]
+
+                        text = None
+
+                        # If force_ocr is True, skip embedded text extraction entirely
+                        if force_ocr:
+                            logger.info(f"Page {page_num + 1}: Forcing vision OCR (ignoring embedded text)")
+                        else:
+                            # First try to extract embedded text
+                            text = page.get_text()
+
+                        # Use vision OCR if: forced, no embedded text, or embedded text too short
+                        should_use_vision_ocr = force_ocr or (not text or len(text.strip()) < 50)
+                        vision_future = None
+                        img_path = None
+
+                        if should_use_vision_ocr and self.enabled:
+                            if not force_ocr:
+                                logger.info(f"Page {page_num + 1}: Embedded text too short ({len(text.strip()) if text else 0} chars), attempting vision OCR")
+
+                            self._initialize_client()
+                            if self._ollama_client:
+                                # Wait for a slot so rendering stays a bounded distance ahead of OCR
+                                render_slots.acquire()
+                                try:
+                                    # Convert page to image with unique temp file to avoid collisions
+                                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better quality
+
+                                    # Use tempfile to create unique file per page/document
+                                    fd, img_path = tempfile.mkstemp(suffix=".png", prefix=f"ocr_page_{page_num}_")
+                                    os.close(fd)  # Close file descriptor, we'll write with PyMuPDF
+
+                                    pix.save(img_path)
+                                    logger.info(f"Page {page_num + 1}: Saved page image to {img_path}, queueing Ollama vision API call...")
+
+                                    # Run vision OCR on the image in the background
+                                    vision_future = executor.submit(self._extract_text_from_page_image, img_path)
+                                except Exception:
+                                    render_slots.release()
+                                    if img_path:
+                                        Path(img_path).unlink(missing_ok=True)
+                                    raise
+                                vision_future.add_done_callback(lambda _: render_slots.release())
+                        else:
+                            if text:
+                                logger.info(f"Page {page_num + 1}: Extracted {len(text.strip())} chars of embedded text")
+
+                        pages.append((page_num, text, vision_future))
+
+                    except Exception as e:
+                        logger.error(f"Failed to process page {page_num + 1} of {pdf_path}: {type(e).__name__}: {str(e)}", exc_info=True)
+                        # Continue with other pages even if one fails
+                        continue
+
+                # Collect results in page order
+                for page_num, text, vision_future in pages:
+                    try:
+                        if vision_future is not None:
+                            vision_text = vision_future.result()
                             if vision_text:
                                 logger.info(f"Page {page_num + 1}: Vision OCR extracted {len(vision_text)} characters")
                                 text = vision_text
                             else:
                                 logger.warning(f"Page {page_num + 1}: Vision OCR returned None or empty text")
 
-                            # Clean up temp file
-                            Path(img_path).unlink(missing_ok=True)
-                    else:
                         if text:
-                            logger.info(f"Page {page_num + 1}: Extracted {len(text.strip())} chars of embedded text")
-
-                    if text:
-                        all_text.append(text)
-                        processed_pages.append(page_num + 1)
-                    else:
-                        logger.warning(f"Page {page_num + 1}: No text extracted (text is None or empty)")
-
-                except Exception as e:
-                    logger.error(f"Failed to process page {page_num + 1} of {pdf_path}: {type(e).__name__}: {str(e)}", exc_info=True)
-                    # Continue with other pages even if one fails
-                    continue
+                            all_text.append(text)
+                            processed_pages.append(page_num + 1)
+                        else:
+                            logger.warning(f"Page {page_num + 1}: No text extracted (text is None or empty)")
+
+                    except Exception as e:
+                        logger.error(f"Failed to process page {page_num + 1} of {pdf_path}: {type(e).__name__}: {str(e)}", exc_info=True)
 
             doc.close()
             total_text = "\n\n".join(all_text)
@@ -1,8 +1,11 @@
 """OIDC authentication service."""
 import logging
+import time
 from typing import Dict, Optional, Any
 from datetime import datetime, timedelta
 import httpx
+import jwt
+from jwt import PyJWKClient
 from authlib.integrations.starlette_client import OAuth
 from authlib.oauth2.rfc6749 import OAuth2Token
 
@@ -17,6 +20,10 @@ logger = logging.getLogger(__name__)
 class OIDCService:
     """Service for handling OIDC authentication."""
 
+    METADATA_TTL = 3600  # Re-fetch discovery document hourly
+    JWKS_LIFESPAN = 3600  # PyJWKClient key cache lifetime in seconds
+    SIGNING_KEY_CACHE_SIZE = 16  # Providers rarely publish more than a few keys
+
     def __init__(self):
         """Initialize OIDC service."""
         self.enabled = settings.OIDC_ENABLED
@@ -27,6 +34,11 @@ class OIDCService:
         self.scopes = " ".join(settings.OIDC_SCOPES)
 
         self._metadata: Optional[Dict[str, Any]] = None
+        self._metadata_fetched_at: float = 0.0
+        self._jwks_client: Optional[PyJWKClient] = None
+        self._jwks_uri: Optional[str] = None
+        self._signing_keys: Dict[str, Any] = {}
+        self._signing_keys_reset_at: float = 0.0
         self.oauth = None
 
         if self.enabled:
@@ -54,14 +66,29 @@ class OIDCService:
             logger.error(f"Failed to initialize OIDC service: {e}", exc_info=True)
             self.enabled = False
 
+    def _get_cached_metadata(self) -> Optional[Dict[str, Any]]:
+        """Return cached provider metadata if it has not expired."""
+        if self._metadata and time.monotonic() - self._metadata_fetched_at < self.METADATA_TTL:
+            return self._metadata
+        return None
+
+    def _set_cached_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Store provider metadata and record when it was fetched."""
+        self._metadata = metadata
+        self._metadata_fetched_at = time.monotonic()
+        return metadata
+
     async def get_provider_metadata(self) -> Dict[str, Any]:
         """Fetch OIDC provider metadata from discovery endpoint.
 
+        Metadata is cached in-process for METADATA_TTL seconds.
+
         Returns:
             Provider metadata dictionary
         """
-        if self._metadata:
-            return self._metadata
+        cached = self._get_cached_metadata()
+        if cached:
+            return cached
 
         if not self.discovery_url:
             raise ValueError("OIDC discovery URL not configured")
@@ -70,9 +97,9 @@ class OIDCService:
             async with httpx.AsyncClient() as client:
                 response = await client.get(self.discovery_url)
                 response.raise_for_status()
-                self._metadata = response.json()
+                metadata = self._set_cached_metadata(response.json())
                 logger.info("OIDC provider metadata fetched successfully")
-                return self._metadata
+                return metadata
         except Exception as e:
             logger.error(f"Failed to fetch OIDC provider metadata: {e}", exc_info=True)
             raise
@@ -89,8 +116,7 @@ class OIDCService:
         if not self.enabled:
             raise ValueError("OIDC is not enabled")
 
-        # Get provider metadata synchronously for URL construction
-        # Note: In production, this should be cached
+        # Get provider metadata synchronously for URL construction (cached)
         try:
             # Build authorization URL manually
             metadata = self._get_metadata_sync()
@@ -123,18 +149,72 @@ class OIDCService:
         Returns:
             Provider metadata dictionary
         """
-        if self._metadata:
-            return self._metadata
+        cached = self._get_cached_metadata()
+        if cached:
+            return cached
 
         try:
             response = httpx.get(self.discovery_url, timeout=10)
             response.raise_for_status()
-            self._metadata = response.json()
-            return self._metadata
+            return self._set_cached_metadata(response.json())
         except Exception as e:
             logger.error(f"Failed to fetch provider metadata: {e}", exc_info=True)
             raise
 
+    def get_jwks_client(self, jwks_uri: str) -> PyJWKClient:
+        """Get a process-wide JWKS client for the provider's signing keys.
+
+        The client caches fetched keys itself, so reusing it avoids a JWKS
+        round-trip on every ID token verification.
+
+        Args:
+            jwks_uri: JWKS endpoint from provider metadata
+
+        Returns:
+            Shared PyJWKClient instance
+        """
+        if self._jwks_client is None or self._jwks_uri != jwks_uri:
+            self._jwks_client = PyJWKClient(
+                jwks_uri,
+                cache_keys=True,
+                lifespan=self.JWKS_LIFESPAN
+            )
+            self._jwks_uri = jwks_uri
+            self._signing_keys.clear()
+        return self._jwks_client
+
+    def get_signing_key(self, jwks_uri: str, id_token: str) -> Any:
+        """Get the key that signed an ID token, memoized by key ID (kid).
+
+        Only the unverified header is parsed to find the kid; keys are kept for
+        JWKS_LIFESPAN seconds so rotated-out keys eventually age out.
+
+        Args:
+            jwks_uri: JWKS endpoint from provider metadata
+            id_token: Encoded ID token
+
+        Returns:
+            Public key suitable for jwt.decode
+        """
+        jwks_client = self.get_jwks_client(jwks_uri)
+        kid = jwt.get_unverified_header(id_token).get("kid")
+        if not kid:
+            return jwks_client.get_signing_key_from_jwt(id_token).key
+
+        now = time.monotonic()
+        if now - self._signing_keys_reset_at >= self.JWKS_LIFESPAN:
+            self._signing_keys.clear()
+            self._signing_keys_reset_at = now
+
+        key = self._signing_keys.get(kid)
+        if key is None:
+            key = jwks_client.get_signing_key(kid).key
+            if len(self._signing_keys) >= self.SIGNING_KEY_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                self._signing_keys.pop(next(iter(self._signing_keys)))
+            self._signing_keys[kid] = key
+        return key
+
     async def exchange_code_for_token(self, code: str) -> OAuth2Token:
         """Exchange authorization code for access token.
 
@@ -1,17 +1,28 @@
 """Search service for document full-text search."""
 import logging
-from typing import List, Optional
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Pattern, Tuple, Union
 from uuid import UUID
 
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from app.models.document import Document
-from app.schemas.document import DocumentResponse
+from app.schemas.document import DocumentResponse, document_list_adapter
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PreparedQuery:
+    """Search query split and compiled once, reusable across many documents."""
+
+    terms: Tuple[str, ...]
+    term_patterns: Tuple[Pattern[str], ...]  # Case-insensitive pattern per term
+    highlighter: Optional[Pattern[str]]  # Alternation of all terms
+
+
 class SearchService:
     """Service for document search operations."""
 
@@ -24,15 +35,40 @@ class SearchService:
         """
         self.db = db
 
+    @classmethod
+    def prepare_query(cls, query: str) -> PreparedQuery:
+        """
+        Pre-process a search query for snippet extraction and highlighting.
+
+        Call once per request and pass the result to extract_snippet for every
+        document, so the query is split and its patterns compiled only once.
+
+        Args:
+            query: Search query
+
+        Returns:
+            PreparedQuery with terms and compiled patterns
+        """
+        terms = tuple(term.strip() for term in (query or "").split() if term.strip())
+        return PreparedQuery(
+            terms=terms,
+            term_patterns=tuple(re.compile(re.escape(term), re.IGNORECASE) for term in terms),
+            highlighter=cls._compile_highlighter(list(terms)),
+        )
+
     def extract_snippet(
-        self, text: str, query: str, context_chars: int = 150, max_snippets: int = 2
+        self,
+        text: str,
+        query: Union[str, PreparedQuery],
+        context_chars: int = 150,
+        max_snippets: int = 2,
     ) -> List[str]:
         """
         Extract snippets from text around keyword matches with highlighted terms.
 
         Args:
             text: Text to search in
-            query: Search query
+            query: Search query, or a PreparedQuery from prepare_query
             context_chars: Number of characters to include before/after match
             max_snippets: Maximum number of snippets to return
 
@@ -42,30 +78,26 @@ class SearchService:
         if not text or not query:
             return []
 
-        # Split query into terms
-        terms = [term.strip() for term in query.split() if term.strip()]
-        if not terms:
+        prepared = query if isinstance(query, PreparedQuery) else self.prepare_query(query)
+        if not prepared.terms:
             return []
 
         snippets = []
-        text_lower = text.lower()
 
         # Find matches for each term
-        for term in terms[:max_snippets]:  # Limit to first few terms
-            term_lower = term.lower()
-            # Find first occurrence of this term
-            match_pos = text_lower.find(term_lower)
+        for pattern in prepared.term_patterns[:max_snippets]:  # Limit to first few terms
+            # Find first occurrence of this term (case-insensitive, no lowered copy of text)
+            match = pattern.search(text)
 
-            if match_pos != -1:
+            if match:
                 # Extract context around the match
-                # Use len(term_lower) to match the search position calculation
-                start = max(0, match_pos - context_chars)
-                end = min(len(text), match_pos + len(term_lower) + context_chars)
+                start = max(0, match.start() - context_chars)
+                end = min(len(text), match.end() + context_chars)
 
                 snippet = text[start:end].strip()
 
                 # Highlight all occurrences of search terms in the snippet
-                snippet = self._highlight_terms(snippet, terms)
+                snippet = self._highlight_terms(snippet, prepared.highlighter)
 
                 # Add ellipsis if we're not at the start/end
                 if start > 0:
@@ -81,28 +113,42 @@ class SearchService:
 
         return snippets
 
-    def _highlight_terms(self, text: str, terms: List[str]) -> str:
+    @staticmethod
+    def _compile_highlighter(terms: List[str]) -> Optional[Pattern[str]]:
+        """
+        Compile a single case-insensitive pattern matching any of the terms.
+
+        Build it once per query and reuse it for every snippet/chunk that needs
+        highlighting.
+
+        Args:
+            terms: List of terms to highlight
+
+        Returns:
+            Compiled alternation pattern, or None if there are no terms
+        """
+        terms = [term for term in terms if term]
+        if not terms:
+            return None
+        # Longest first so overlapping terms prefer the fuller match
+        terms = sorted(set(terms), key=len, reverse=True)
+        return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+    def _highlight_terms(self, text: str, pattern: Optional[Pattern[str]]) -> str:
         """
         Wrap matched terms in <mark> tags for highlighting.
 
         Args:
             text: Text to highlight
-            terms: List of terms to highlight
+            pattern: Pattern from _compile_highlighter
 
         Returns:
             Text with matched terms wrapped in <mark> tags
         """
-        import re
-        
-        result = text
-        for term in terms:
-            if not term:
-                continue
-            # Case-insensitive replacement, preserving original case
-            pattern = re.compile(re.escape(term), re.IGNORECASE)
-            result = pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", result)
-        
-        return result
+        if pattern is None:
+            return text
+        # Case-insensitive replacement, preserving original case
+        return pattern.sub(r"<mark>\g<0></mark>", text)
 
     def search_documents(
         self,
@@ -133,7 +179,7 @@ class SearchService:
                 .limit(limit)
                 .all()
             )
-            return [DocumentResponse.model_validate(doc) for doc in documents]
+            return document_list_adapter.validate_python(documents, from_attributes=True)
 
         # Use PostgreSQL ILIKE for case-insensitive search
         # In production, you'd want to use ts_vector for better performance
@@ -157,7 +203,7 @@ class SearchService:
             .all()
         )
 
-        return [DocumentResponse.model_validate(doc) for doc in documents]
+        return document_list_adapter.validate_python(documents, from_attributes=True)
 
     def count_search_results(self, query: str, user_id: UUID) -> int:
         """
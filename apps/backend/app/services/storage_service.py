@@ -2,17 +2,21 @@
 import hashlib
 import logging
 import os
-import shutil
 from pathlib import Path
 from typing import BinaryIO, Optional, Tuple
 from uuid import UUID
 
+import aiofiles
 from fastapi import UploadFile
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Uploads are streamed to disk in chunks this size (fewer read/write round-trips
+# through the threadpool than small chunks, bounded memory for large files)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class StorageService:
     """Service for handling file storage operations."""
@@ -153,21 +157,95 @@ class StorageService:
         file_path = doc_path / safe_filename
 
         # Save file initially
+        await self._write_upload(file, file_path)
+
+        return self._finalize_saved_file(file_path, file.content_type, convert_images_to_pdf)
+
+    async def save_file_with_checksum(
+        self,
+        file: UploadFile,
+        document_id: UUID,
+        filename: str,
+        convert_images_to_pdf: bool = True
+    ) -> Tuple[str, str, str, str]:
+        """
+        Save uploaded file to storage and compute its SHA-256 checksum in one pass.
+
+        Equivalent to calculate_checksum() followed by save_file(), but the upload is
+        read only once. The checksum is of the uploaded bytes, before any image to
+        PDF conversion.
+
+        Args:
+            file: Uploaded file
+            document_id: Document UUID
+            filename: Original filename
+            convert_images_to_pdf: Whether to convert images to PDF (default: True)
+
+        Returns:
+            Tuple of (relative_path, final_filename, mime_type, checksum)
+        """
+        doc_path = self._get_document_path(document_id)
+
+        # Sanitize filename to prevent directory traversal
+        safe_filename = os.path.basename(filename)
+        file_path = doc_path / safe_filename
+
+        sha256_hash = hashlib.sha256()
+        await self._write_upload(file, file_path, sha256_hash)
+
+        relative_path, final_filename, mime_type = self._finalize_saved_file(
+            file_path, file.content_type, convert_images_to_pdf
+        )
+        return relative_path, final_filename, mime_type, sha256_hash.hexdigest()
+
+    async def _write_upload(self, file: UploadFile, file_path: Path, hasher=None) -> None:
+        """
+        Stream an upload to disk in UPLOAD_CHUNK_SIZE chunks without blocking the event loop.
+
+        Reads go through UploadFile's threadpool-backed read() and writes through
+        aiofiles, so a multi-MB upload never stalls other requests. If a hashlib
+        object is given, each chunk is fed to it on the way through.
+        """
         await file.seek(0)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if hasher is not None:
+                    hasher.update(chunk)
+                await buffer.write(chunk)
 
+    def convert_saved_file(self, relative_path: str, content_type: Optional[str]) -> Tuple[str, str, str]:
+        """
+        Convert a file saved with convert_images_to_pdf=False, if it is an image.
+
+        Lets callers defer the conversion until they know the file is kept.
+
+        Args:
+            relative_path: Relative path returned when the file was saved
+            content_type: MIME type of the saved file
+
+        Returns:
+            Tuple of (relative_path, final_filename, mime_type)
+        """
+        return self._finalize_saved_file(self.get_file_path(relative_path), content_type, True)
+
+    def _finalize_saved_file(
+        self,
+        file_path: Path,
+        content_type: Optional[str],
+        convert_images_to_pdf: bool
+    ) -> Tuple[str, str, str]:
+        """Convert a saved image to PDF if needed and return (relative_path, final_filename, mime_type)."""
         # Convert images to PDF
-        if convert_images_to_pdf and self._is_image_file(safe_filename):
-            logger.info(f"Image file detected, converting to PDF: {safe_filename}")
+        if convert_images_to_pdf and self._is_image_file(file_path.name):
+            logger.info(f"Image file detected, converting to PDF: {file_path.name}")
             pdf_path = self._convert_image_to_pdf(file_path)
             final_path = pdf_path
             final_filename = pdf_path.name
             mime_type = "application/pdf"
         else:
             final_path = file_path
-            final_filename = safe_filename
-            mime_type = file.content_type or "application/octet-stream"
+            final_filename = file_path.name
+            mime_type = content_type or "application/octet-stream"
 
         # Return relative path from base_path
         relative_path = str(final_path.relative_to(self.base_path))
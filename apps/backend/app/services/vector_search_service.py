@@ -1,16 +1,29 @@
 """Vector search service for semantic similarity search."""
 import logging
-from typing import List, Tuple, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.models.document import Document, DocumentEmbedding
-from app.services.embedding_service import EmbeddingService
+from app.services.embedding_service import EmbeddingService, get_embedding_service
 
 logger = logging.getLogger(__name__)
 
+# Reciprocal Rank Fusion: 1 / (k + rank) for 1-based ranks, precomputed once.
+# hybrid_search fetches 2 * limit results per method and limit is capped at 100,
+# so 1000 entries cover every rank; larger ranks fall back to dividing.
+RRF_K = 60
+_RRF_RECIPROCALS: Tuple[float, ...] = tuple(1.0 / (RRF_K + rank) for rank in range(1, 1001))
+
+
+def _rrf_reciprocal(rank: int) -> float:
+    """Return 1 / (RRF_K + rank) for a 1-based rank."""
+    if rank <= len(_RRF_RECIPROCALS):
+        return _RRF_RECIPROCALS[rank - 1]
+    return 1.0 / (RRF_K + rank)
+
 
 class VectorSearchService:
     """Service for performing vector similarity search."""
@@ -21,24 +34,20 @@ class VectorSearchService:
 
         Args:
             db: Database session
-            embedding_service: Optional embedding service (will create if not provided)
+            embedding_service: Optional embedding service (defaults to the shared instance)
         """
         self.db = db
-        if embedding_service:
-            self.embedding_service = embedding_service
-        else:
-            # Create embedding service with settings
-            from app.config import settings
-            self.embedding_service = EmbeddingService(
-                provider=settings.EMBEDDING_PROVIDER,
-                model_name=settings.EMBEDDING_MODEL,
-                api_key=settings.OPENAI_API_KEY if settings.EMBEDDING_PROVIDER == "openai" else None,
-                dimension=settings.EMBEDDING_DIMENSION,
-            )
+        self.embedding_service = embedding_service or get_embedding_service()
 
     def vector_search(
-        self, query: str, user_id: UUID, limit: int = 10, similarity_threshold: float = 0.3
-    ) -> List[Tuple[Document, float, str]]:
+        self,
+        query: str,
+        user_id: UUID,
+        limit: int = 10,
+        similarity_threshold: float = 0.3,
+        query_embedding: Optional[Sequence[float]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Tuple[Any, ...]]:
         """
         Perform vector similarity search.
 
@@ -48,17 +57,24 @@ class VectorSearchService:
             limit: Maximum number of results
             similarity_threshold: Minimum cosine similarity score (0-1). Default 0.3 filters out irrelevant results.
                                   0.8-1.0: Very relevant, 0.6-0.8: Moderately relevant, 0.3-0.6: Somewhat relevant
+            query_embedding: Optional precomputed embedding of the query, as a list or
+                1-D array (skips embedding it again)
+            include_embeddings: Also return each matched chunk's stored embedding
 
         Returns:
-            List of (Document, similarity_score, chunk_text) tuples, ordered by similarity desc
+            List of (Document, similarity_score, chunk_text) tuples, ordered by similarity desc.
+            With include_embeddings, each tuple also carries the chunk embedding as a list of floats.
         """
-        # Generate embedding for query
-        query_embedding = self.embedding_service.generate_embedding(query)
+        # Generate embedding for query (EmbeddingService caches repeated queries)
+        if query_embedding is None:
+            query_embedding = self.embedding_service.generate_embedding(query)
 
         # Perform vector search using pgvector's cosine similarity operator (<=>)
         # Note: pgvector uses distance (lower is better), so we calculate 1 - distance to get similarity
         # Format embedding as PostgreSQL array literal
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+        embedding_str = "[" + ",".join(str(float(x)) for x in query_embedding) + "]"
+        # Cast to real[] so the driver returns a list of floats instead of vector text
+        embedding_column = ",\n                de.embedding::real[] as embedding" if include_embeddings else ""
 
         # Build the SQL query with direct string formatting for the vector
         # (SQLAlchemy text() doesn't handle vector type well with parameters)
@@ -77,7 +93,7 @@ class VectorSearchService:
                 d.updated_at,
                 d.uploaded_by,
                 de.chunk_text,
-                1 - (de.embedding <=> '{embedding_str}'::vector) as similarity
+                1 - (de.embedding <=> '{embedding_str}'::vector) as similarity{embedding_column}
             FROM documents d
             INNER JOIN document_embeddings de ON d.id = de.document_id
             WHERE d.owner_id = :user_id
@@ -115,7 +131,10 @@ class VectorSearchService:
             )
             similarity = float(row.similarity)
             chunk_text = row.chunk_text or ""
-            results.append((doc, similarity, chunk_text))
+            if include_embeddings:
+                results.append((doc, similarity, chunk_text, row.embedding))
+            else:
+                results.append((doc, similarity, chunk_text))
 
         return results
 
@@ -128,6 +147,7 @@ class VectorSearchService:
         vector_weight: float = 0.5,
         similarity_threshold: float = 0.3,
         min_rrf_score: float = 0.005,
+        query_embedding: Optional[Sequence[float]] = None,
     ) -> List[Tuple[Document, float, Optional[str]]]:
         """
         Perform hybrid search combining full-text and vector search using RRF.
@@ -144,6 +164,7 @@ class VectorSearchService:
             vector_weight: Weight for vector search results (0-1)
             similarity_threshold: Minimum similarity for vector results (0-1)
             min_rrf_score: Minimum RRF score to include in results
+            query_embedding: Optional precomputed embedding of the query, passed to vector_search
 
         Returns:
             List of (Document, rrf_score, chunk_text) tuples, ordered by RRF score desc
@@ -153,37 +174,43 @@ class VectorSearchService:
         # Perform both searches
         search_service = SearchService(self.db)
         fts_results = search_service.search_documents(query, user_id, skip=0, limit=limit * 2)
-        vector_results = self.vector_search(query, user_id, limit=limit * 2, similarity_threshold=similarity_threshold)
+        vector_results = self.vector_search(
+            query,
+            user_id,
+            limit=limit * 2,
+            similarity_threshold=similarity_threshold,
+            query_embedding=query_embedding,
+        )
 
-        # Apply Reciprocal Rank Fusion
-        k = 60  # RRF constant
+        # Apply Reciprocal Rank Fusion (k = RRF_K)
         doc_scores = {}
         doc_chunks = {}  # Store chunk_text from vector results
 
         # Add FTS scores
         for rank, doc in enumerate(fts_results, start=1):
             doc_id = doc.id
-            rrf_score = fts_weight / (k + rank)
+            rrf_score = fts_weight * _rrf_reciprocal(rank)
             doc_scores[doc_id] = doc_scores.get(doc_id, 0) + rrf_score
 
         # Add vector search scores
         for rank, (doc, similarity, chunk_text) in enumerate(vector_results, start=1):
             doc_id = doc.id
-            rrf_score = vector_weight / (k + rank)
+            rrf_score = vector_weight * _rrf_reciprocal(rank)
             doc_scores[doc_id] = doc_scores.get(doc_id, 0) + rrf_score
             # Store the chunk_text from the best matching chunk
             if doc_id not in doc_chunks:
                 doc_chunks[doc_id] = chunk_text
 
         # Sort by RRF score and fetch full document objects
-        sorted_doc_ids = sorted(doc_scores.keys(), key=lambda x: doc_scores[x], reverse=True)
+        # Filter by minimum RRF score to remove irrelevant results before sorting
+        sorted_doc_ids = sorted(
+            (doc_id for doc_id, score in doc_scores.items() if score >= min_rrf_score),
+            key=doc_scores.__getitem__,
+            reverse=True,
+        )
         results = []
 
         for doc_id in sorted_doc_ids:
-            # Filter by minimum RRF score to remove irrelevant results
-            if doc_scores[doc_id] < min_rrf_score:
-                continue
-                
             doc = (
                 self.db.query(Document)
                 .filter(Document.id == doc_id, Document.owner_id == user_id)
@@ -1,33 +1,69 @@
 """Background service to broadcast Redis events to WebSocket clients."""
+import asyncio
 import logging
 
 import redis.asyncio as aioredis
-from app.api.v1.websocket import manager
+from app.api.v1.websocket import REDIS_CHANNEL, manager
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Process-wide pool; the subscriber lives for the whole app lifetime so the
+# connection is opened once at startup instead of per first/last websocket.
+# Payloads stay as raw bytes; ConnectionManager decodes only for text clients.
+_pool = aioredis.ConnectionPool.from_url(
+    settings.REDIS_URL, decode_responses=False, max_connections=4
+)
 
-async def start_broadcaster():
-    """Subscribe to Redis pub/sub and broadcast to WebSocket clients."""
-    redis = await aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-    pubsub = redis.pubsub()
-    await pubsub.subscribe("cartulary:events")
+# Reconnect delay after a Redis error, doubling per consecutive failure up to the cap
+RECONNECT_INITIAL_DELAY_SECONDS = 1.0
+RECONNECT_MAX_DELAY_SECONDS = 30.0
 
-    logger.info("WebSocket broadcaster started, listening on channel: cartulary:events")
 
+async def _close_pubsub(pubsub) -> None:
+    """Unsubscribe and close a pub/sub, tolerating an already dead connection."""
+    try:
+        await pubsub.unsubscribe(REDIS_CHANNEL)
+    except Exception as e:
+        logger.debug(f"Broadcaster unsubscribe failed: {e}")
     try:
-        async for message in pubsub.listen():
-            logger.debug(f"Received Redis message: {message}")
-            if message["type"] == "message":
-                logger.info(f"Broadcasting message to {len(manager.active_connections)} WebSocket clients: {message['data'][:100]}...")
-                # Broadcast to all WebSocket connections
-                await manager.broadcast(message["data"])
-            elif message["type"] == "subscribe":
-                logger.info(f"Successfully subscribed to channel: {message['channel']}")
+        await pubsub.close()
     except Exception as e:
-        logger.error(f"Broadcaster error: {e}", exc_info=True)
-    finally:
-        await pubsub.unsubscribe("cartulary:events")
-        await redis.close()
+        logger.debug(f"Broadcaster pub/sub close failed: {e}")
+
+
+async def start_broadcaster():
+    """Subscribe to Redis pub/sub and broadcast to WebSocket clients.
+
+    Started once from the app lifespan and runs until it is cancelled on shutdown.
+    Redis errors (restarts, network blips, idle timeouts) are logged and the
+    subscription is re-established with capped exponential backoff.
+    """
+    redis = aioredis.Redis(connection_pool=_pool)
+    delay = RECONNECT_INITIAL_DELAY_SECONDS
+
+    try:
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(REDIS_CHANNEL)
+                logger.info(f"WebSocket broadcaster started, listening on channel: {REDIS_CHANNEL}")
+                delay = RECONNECT_INITIAL_DELAY_SECONDS
+
+                async for message in pubsub.listen():
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Broadcasting message to {len(manager.active_connections)} WebSocket clients: {message['data'][:100]}...")
+                    await manager.broadcast(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Broadcaster error, reconnecting in {delay:.0f}s: {e}", exc_info=True)
+            finally:
+                await _close_pubsub(pubsub)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+    except asyncio.CancelledError:
+        await _pool.disconnect()
         logger.info("WebSocket broadcaster stopped")
+        raise
@@ -1,7 +1,7 @@
 """Celery application configuration."""
 import logging
 from celery import Celery
-from celery.signals import worker_ready
+from celery.signals import worker_process_init, worker_process_shutdown, worker_ready
 
 from app.config import settings
 
@@ -12,7 +12,7 @@ celery_app = Celery(
     "cartulary",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.tasks.document_tasks"],  # Include task modules
+    include=["app.tasks.document_tasks", "app.tasks.maintenance_tasks"],  # Include task modules
 )
 
 # Configure Celery
@@ -25,6 +25,12 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    beat_schedule={
+        "maintain-activity-log-partitions": {
+            "task": "app.tasks.maintain_activity_log_partitions",
+            "schedule": 24 * 60 * 60,  # daily
+        },
+    },
 )
 
 
@@ -38,3 +44,19 @@ def on_worker_ready(sender, **kwargs):
     except Exception as e:
         logger.error(f"Celery worker startup validation failed: {e}")
         # Log but don't crash the worker
+
+
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    """Batch notification publishes in each worker process (bulk ingest emits bursts)."""
+    from app.services.notification_service import notification_service
+
+    notification_service.enable_publish_queue()
+
+
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(**kwargs):
+    """Send queued notifications before the process exits (atexit doesn't run here)."""
+    from app.services.notification_service import notification_service
+
+    notification_service.flush_pending_sync()
@@ -10,7 +10,7 @@ from app.config import settings
 from app.database import SessionLocal
 from app.models.document import Document, DocumentEmbedding
 from app.services.ocr_service import OCRService
-from app.services.embedding_service import EmbeddingService
+from app.services.embedding_service import get_embedding_service
 from app.services.notification_service import notification_service
 from app.tasks.celery_app import celery_app
 
@@ -249,13 +249,8 @@ def generate_embeddings(self, document_id: str) -> dict:
         logger.info(f"About to initialize EmbeddingService with provider={settings.EMBEDDING_PROVIDER}")
 
         try:
-            embedding_service = EmbeddingService(
-                provider=settings.EMBEDDING_PROVIDER,
-                model_name=settings.EMBEDDING_MODEL,
-                api_key=settings.OPENAI_API_KEY if settings.EMBEDDING_PROVIDER == "openai" else None,
-                dimension=settings.EMBEDDING_DIMENSION,
-                base_url=settings.LLM_BASE_URL if settings.EMBEDDING_PROVIDER == "ollama" else None,
-            )
+            # Shared per process, so a local model is loaded once per worker, not per task
+            embedding_service = get_embedding_service()
             logger.info(f"EmbeddingService initialized successfully")
         except Exception as init_error:
             logger.error(f"Failed to initialize EmbeddingService: {init_error}", exc_info=True)
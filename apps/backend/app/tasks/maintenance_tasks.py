@@ -0,0 +1,107 @@
+"""Celery tasks for periodic database maintenance."""
+import logging
+from datetime import date, datetime
+
+from sqlalchemy import text as sql_text
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+# How many future monthly activity_logs partitions to keep created
+ACTIVITY_LOG_PARTITION_MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    """Return the first day of the month `months` after `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_activity_log_partition(db: Session, name: str, month: date, upper: date) -> int:
+    """
+    Create one monthly partition, moving any of its rows out of activity_logs_default.
+
+    Postgres refuses to add a partition whose range already has rows in the default
+    partition (e.g. logged while beat was down), so in that case the default is
+    detached, the rows are moved into the new partition and the default is reattached.
+
+    Returns:
+        Number of rows moved from activity_logs_default
+    """
+    bounds = {"lower": month, "upper": upper}
+    in_range = "created_at >= :lower AND created_at < :upper"
+    has_default_rows = db.execute(
+        sql_text(f"SELECT EXISTS (SELECT 1 FROM activity_logs_default WHERE {in_range})"),
+        bounds,
+    ).scalar()
+
+    create = sql_text(
+        f"CREATE TABLE {name} PARTITION OF activity_logs "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+    )
+    if not has_default_rows:
+        db.execute(create)
+        return 0
+
+    db.execute(sql_text("ALTER TABLE activity_logs DETACH PARTITION activity_logs_default"))
+    db.execute(create)
+    moved = db.execute(
+        sql_text(f"INSERT INTO {name} SELECT * FROM activity_logs_default WHERE {in_range}"),
+        bounds,
+    ).rowcount
+    db.execute(sql_text(f"DELETE FROM activity_logs_default WHERE {in_range}"), bounds)
+    db.execute(sql_text("ALTER TABLE activity_logs ATTACH PARTITION activity_logs_default DEFAULT"))
+    return moved
+
+
+@celery_app.task(name="app.tasks.maintain_activity_log_partitions")
+def maintain_activity_log_partitions() -> dict:
+    """
+    Create upcoming monthly partitions for the activity_logs table.
+
+    Runs ahead of time so new rows land in their month's partition rather than
+    activity_logs_default. Old partitions can be detached/dropped manually to
+    expire history without a bulk DELETE. Each month is created in its own
+    transaction, so one failing month doesn't block the others.
+
+    Returns:
+        Result dict with the partitions that were created and any that failed
+    """
+    db: Session = SessionLocal()
+    created = []
+    failed = []
+
+    try:
+        month = datetime.utcnow().date().replace(day=1)
+        for _ in range(ACTIVITY_LOG_PARTITION_MONTHS_AHEAD + 1):
+            upper = _add_months(month, 1)
+            name = f"activity_logs_y{month.year:04d}m{month.month:02d}"
+
+            try:
+                exists = db.execute(
+                    sql_text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+                ).scalar()
+                if not exists:
+                    moved = _create_activity_log_partition(db, name, month, upper)
+                    db.commit()
+                    created.append(name)
+                    if moved:
+                        logger.info(f"Moved {moved} rows from activity_logs_default into {name}")
+            except Exception as e:
+                db.rollback()
+                failed.append(name)
+                logger.error(f"Failed to create activity_logs partition {name}: {e}", exc_info=True)
+
+            month = upper
+
+        if created:
+            logger.info(f"Created activity_logs partitions: {', '.join(created)}")
+        if failed:
+            return {"status": "error", "created": created, "failed": failed}
+        return {"status": "success", "created": created}
+
+    finally:
+        db.close()
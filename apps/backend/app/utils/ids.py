@@ -0,0 +1,49 @@
+"""Identifier generation helpers."""
+import os
+import threading
+import time
+import uuid
+
+_uuid7_lock = threading.Lock()
+_last_uuid7_ms = 0
+_last_uuid7_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so ids generated later
+    sort later and primary key inserts land on the right-most B-tree page instead
+    of a random one. Within the same millisecond a 12-bit counter keeps ids
+    monotonic for this process; the remaining 62 bits are random.
+
+    Returns:
+        New UUIDv7
+    """
+    global _last_uuid7_ms, _last_uuid7_seq
+
+    with _uuid7_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_uuid7_ms:
+            _last_uuid7_ms = now_ms
+            _last_uuid7_seq = int.from_bytes(os.urandom(2), "big") & 0x3FF
+        else:
+            # Same millisecond (or clock went back): bump the counter, borrowing
+            # a millisecond from the future if it overflows
+            _last_uuid7_seq += 1
+            if _last_uuid7_seq > 0xFFF:
+                _last_uuid7_ms += 1
+                _last_uuid7_seq = 0
+        timestamp_ms = _last_uuid7_ms
+        seq = _last_uuid7_seq
+
+    rand = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76  # version
+        | seq << 64
+        | 0b10 << 62  # RFC 4122 variant
+        | rand
+    )
+    return uuid.UUID(int=value)
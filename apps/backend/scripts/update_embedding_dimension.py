@@ -12,6 +12,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app.core.startup import clear_startup_cache
 from app.database import engine
 from sqlalchemy import text
 
@@ -41,6 +42,8 @@ def update_dimension(new_dimension: int):
 
             # Commit transaction
             trans.commit()
+            # Make the next startup re-check the new column dimension
+            clear_startup_cache()
             print(f"✓ Successfully updated dimension to {new_dimension}")
             print("\nNOTE: You need to regenerate embeddings for all documents.")
 